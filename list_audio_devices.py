@@ -2,14 +2,19 @@ import pyaudio
 
 p = pyaudio.PyAudio()
 
+# Enumerate once - each get_device_info_by_index call is a PortAudio
+# round-trip, so avoid doing it twice per device
+device_infos = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
+
 print('Input Devices:')
-for i in range(p.get_device_count()):
-    info = p.get_device_info_by_index(i)
+for i, info in enumerate(device_infos):
     if info['maxInputChannels'] > 0:
         print(f"Index {i}: {info['name']} (Input)")
 
 print('\nOutput Devices:')
-for i in range(p.get_device_count()):
-    info = p.get_device_info_by_index(i)
+for i, info in enumerate(device_infos):
     if info['maxOutputChannels'] > 0:
         print(f"Index {i}: {info['name']} (Output)")
+
+# Release the PortAudio handle promptly instead of waiting for interpreter exit
+p.terminate()
@@ -1,20 +1,26 @@
-"""
-Script to list available Windows SAPI voices
-"""
-import win32com.client
-
-speaker = win32com.client.Dispatch("SAPI.SpVoice")
-voices = speaker.GetVoices()
-
-print("Available Windows SAPI Voices:")
-print("=" * 60)
-for i in range(voices.Count):
-    voice = voices.Item(i)
-    print(f"\nVoice {i}:")
-    print(f"  Name: {voice.GetDescription()}")
-    print(f"  ID: {voice.Id}")
-    
-print("\n" + "=" * 60)
-print(f"\nCurrent voice: {speaker.Voice.GetDescription()}")
-print(f"Current rate: {speaker.Rate} (range: -10 to 10)")
-print(f"Current volume: {speaker.Volume} (range: 0 to 100)")
+"""
+Script to list available Windows SAPI voices
+"""
+import win32com.client
+
+speaker = win32com.client.Dispatch("SAPI.SpVoice")
+voices = speaker.GetVoices()
+
+# Pull everything out of COM first - each Item/GetDescription/Id access
+# is a marshaled round-trip - then print in one buffered write
+voice_items = [voices.Item(i) for i in range(voices.Count)]
+descriptions = [v.GetDescription() for v in voice_items]
+ids = [v.Id for v in voice_items]
+
+lines = ["Available Windows SAPI Voices:", "=" * 60]
+for i, (desc, voice_id) in enumerate(zip(descriptions, ids)):
+    lines.append(f"\nVoice {i}:")
+    lines.append(f"  Name: {desc}")
+    lines.append(f"  ID: {voice_id}")
+
+lines.append("\n" + "=" * 60)
+lines.append(f"\nCurrent voice: {speaker.Voice.GetDescription()}")
+lines.append(f"Current rate: {speaker.Rate} (range: -10 to 10)")
+lines.append(f"Current volume: {speaker.Volume} (range: 0 to 100)")
+
+print("\n".join(lines))
@@ -2,15 +2,13 @@
 Run application with dummy events for testing
 """
 import sys
-import yaml
 from datetime import datetime, timedelta
 
 sys.path.insert(0, 'src')
 
+# Only import the lightweight event module here - the full application
+# (GUI, audio, TTS) is imported right before it is started
 from event_fetcher import Event
-from display_manager import DisplayManager
-from alarm_system import AlarmSystem
-from main import ReminderSystem
 
 # Monkey patch the fetch method to return dummy events
 def create_dummy_events():
@@ -46,5 +44,7 @@ print("\n⚠️  Note: Voice recognition and chatbot require additional setup")
 print("=" * 60)
 print()
 
+from main import ReminderSystem
+
 system = ReminderSystem('config.yaml')
 system.start()
@@ -1,393 +1,651 @@
-"""
-Alarm System Module
-Handles alarm sounds and Text-to-Speech
-"""
-import os
-import sys
-import platform
-import logging
-import threading
-from typing import Optional
-from datetime import datetime
-import tempfile
-import pygame
-import pyttsx3
-from gtts import gTTS
-from event_fetcher import Event
-
-
-class AlarmSystem:
-    def stop_speaking(self):
-        """Interrupt any ongoing TTS playback (gTTS/pygame or pyttsx3)"""
-        # Interrupt gTTS/pygame playback
-        try:
-            pygame.mixer.music.stop()
-        except Exception:
-            pass
-        # Interrupt pyttsx3 playback
-        if self.tts_engine:
-            try:
-                self.tts_engine.stop()
-            except Exception:
-                pass
-
-    """Manages alarm sounds and text-to-speech notifications"""
-    
-    def __init__(self, config: dict, display_manager=None):
-        self.config = config
-        self.alarm_config = config['alarm']
-        self.tts_config = config['tts']
-        self.logger = logging.getLogger(__name__)
-        
-        # Reference to display manager for showing speech text
-        self.display_manager = display_manager
-        
-        # Detect OS for TTS method selection
-        self.is_windows = platform.system() == 'Windows'
-        self.logger.info(f"Running on {platform.system()}, using {'Windows SAPI' if self.is_windows else 'Linux TTS'}")
-        
-        # Initialize pygame for sound
-        pygame.mixer.init()
-        self.alarm_sound = None
-        self._load_alarm_sound()
-        
-        # Initialize TTS engine
-        self.tts_engine = self._init_tts()
-        
-        # TTS lock to prevent concurrent access
-        self.tts_lock = threading.Lock()
-        
-        # State
-        self.is_playing = False
-        self.alarm_thread: Optional[threading.Thread] = None
-        self.stop_flag = threading.Event()
-        self.current_event: Optional[Event] = None
-        self.last_voice_reminder = None
-        
-    def _load_alarm_sound(self):
-        """Load the alarm sound file"""
-        sound_file = self.alarm_config.get('sound_file')
-        if sound_file and os.path.exists(sound_file):
-            try:
-                self.alarm_sound = pygame.mixer.Sound(sound_file)
-                volume = self.alarm_config.get('volume', 0.8)
-                self.alarm_sound.set_volume(volume)
-                self.logger.info(f"Loaded alarm sound: {sound_file}")
-            except Exception as e:
-                self.logger.error(f"Failed to load alarm sound: {e}")
-        else:
-            self.logger.warning("No alarm sound file configured or file not found")
-    
-    def _init_tts(self) -> pyttsx3.Engine:
-        """Initialize text-to-speech engine"""
-        try:
-            engine = pyttsx3.init(debug=False)
-            
-            # Configure voice
-            rate = self.tts_config.get('rate', 150)
-            volume = self.tts_config.get('volume', 0.9)
-            voice_id = self.tts_config.get('voice')
-            
-            engine.setProperty('rate', rate)
-            engine.setProperty('volume', volume)
-            
-            if voice_id:
-                engine.setProperty('voice', voice_id)
-            
-            # Don't start the loop - we'll use runAndWait() instead
-            # engine.startLoop(False)  # Removed to avoid "run loop already started" error
-            
-            self.logger.info("TTS engine initialized")
-            return engine
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize TTS: {e}")
-            return None
-    
-    def update_tts_settings(self):
-        """Update TTS settings without reinitializing the engine"""
-        try:
-            if self.tts_engine:
-                rate = self.tts_config.get('rate', 150)
-                volume = self.tts_config.get('volume', 0.9)
-                
-                self.tts_engine.setProperty('rate', rate)
-                self.tts_engine.setProperty('volume', volume)
-                
-                self.logger.info(f"TTS settings updated: rate={rate}, volume={volume}")
-        except Exception as e:
-            self.logger.error(f"Failed to update TTS settings: {e}")
-    
-    def trigger_alarm(self, event: Event):
-        """Trigger an alarm for an event"""
-        if self.is_playing:
-            self.logger.warning("Alarm already playing")
-            return
-        
-        self.logger.info(f"Triggering alarm for event: {event.title}")
-        self.is_playing = True
-        self.stop_flag.clear()
-        
-        # Start alarm in separate thread
-        self.alarm_thread = threading.Thread(
-            target=self._alarm_loop,
-            args=(event,),
-            daemon=True
-        )
-        self.alarm_thread.start()
-    
-    def _alarm_loop(self, event: Event):
-        """Main alarm loop (runs in separate thread)"""
-        try:
-            self.current_event = event
-            start_time = datetime.now()
-            self.last_voice_reminder = start_time
-            
-            # Initial announcement
-            print(f"\n{'='*60}")
-            print(f"🔔 VOICE REMINDER TRIGGERED")
-            print(f"{'='*60}")
-            print(f"Event: {event.title}")
-            print(f"Description: {event.description or 'None'}")
-            print(f"Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"{'='*60}\n")
-            
-            print(f"🗣️  About to speak title...")
-            self._speak(f"Reminder: {event.title}")
-            print(f"✅ Title spoken")
-            
-            if event.description:
-                print(f"🗣️  About to speak description...")
-                self._speak(event.description)
-                print(f"✅ Description spoken")
-            
-            print(f"✅ Initial announcement complete\n")
-            
-            # Get intervals
-            sound_repeat_interval = self.alarm_config.get('repeat_interval', 30)
-            voice_reminder_interval = self.alarm_config.get('voice_reminder_interval', 300)
-            auto_stop_after = self.alarm_config.get('auto_stop_after', 1800)
-            
-            print(f"📋 Loop settings: voice_interval={voice_reminder_interval}s, auto_stop={auto_stop_after}s\n")
-            
-            while not self.stop_flag.is_set():
-                print(f"🔄 Loop iteration started...")
-                now = datetime.now()
-                elapsed = (now - start_time).total_seconds()
-                
-                # Check auto-stop timeout
-                if elapsed >= auto_stop_after:
-                    self.logger.info("Alarm auto-stopped after timeout")
-                    print(f"\n⏰ Auto-stopped after {auto_stop_after}s\n")
-                    break
-                
-                # Check if voice reminder is due
-                time_since_last_voice = (now - self.last_voice_reminder).total_seconds()
-                
-                # Debug: Always show status
-                print(f"\r⏲️  Checking... Time since last voice: {int(time_since_last_voice)}s / {voice_reminder_interval}s needed", end='', flush=True)
-                
-                if time_since_last_voice >= voice_reminder_interval:
-                    self.logger.info(f"Voice reminder due (every {voice_reminder_interval}s)")
-                    
-                    # Debug output
-                    print(f"\n{'='*60}")
-                    print(f"🔁 REPEATING VOICE REMINDER")
-                    print(f"{'='*60}")
-                    print(f"Event: {event.title}")
-                    print(f"Description: {event.description or 'None'}")
-                    print(f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-                    print(f"Elapsed: {int((now - start_time).total_seconds())}s")
-                    print(f"Next reminder in: {voice_reminder_interval}s")
-                    print(f"{'='*60}\n")
-                    
-                    self._speak(f"Reminder: {event.title}")
-                    if event.description:
-                        self._speak(event.description)
-                    self.last_voice_reminder = now
-                
-                # No beep sound - only voice reminders
-                if self.stop_flag.is_set():
-                    break
-                
-                # Wait and check voice reminder timing every 10 seconds
-                self.stop_flag.wait(10)
-            
-        except Exception as e:
-            self.logger.error(f"Error in alarm loop: {e}")
-            print(f"\n❌ ERROR in alarm loop: {e}\n")
-        finally:
-            self.is_playing = False
-            self.current_event = None
-            self.last_voice_reminder = None
-            self.logger.info("Alarm stopped")
-            print(f"✅ Alarm loop finished\n")
-    
-    def stop_alarm(self):
-        """Stop the currently playing alarm"""
-        if not self.is_playing:
-            return
-        
-        self.logger.info("Stopping alarm")
-        self.stop_flag.set()
-        
-        # Stop any playing sounds
-        pygame.mixer.stop()
-        
-        # Wait for thread to finish
-        if self.alarm_thread and self.alarm_thread.is_alive():
-            self.alarm_thread.join(timeout=2)
-        
-        self.is_playing = False
-    
-    def _contains_chinese(self, text: str) -> bool:
-        """Check if text contains Chinese characters"""
-        return any('\u4e00' <= char <= '\u9fff' for char in text)
-    
-    def _speak(self, text: str):
-        """Speak text using TTS"""
-        if not self.tts_engine:
-            self.logger.warning("TTS engine not available")
-            print("⚠️  TTS engine not available")
-            return
-        
-        # Use lock to ensure only one TTS operation at a time
-        with self.tts_lock:
-            try:
-                print(f"🔊 Speaking: {text}")
-                self.logger.info(f"Speaking: {text}")
-                
-                # Show text on GUI if display manager is available
-                if self.display_manager:
-                    self.display_manager.show_speaking_text(text)
-                
-                # Use Windows-specific TTS on Windows
-                if self.is_windows:
-                    self._speak_windows(text)
-                else:
-                    self._speak_linux(text)
-                
-                # Hide speaking text after speech completes
-                if self.display_manager:
-                    self.display_manager.hide_speaking_text()
-                
-                print(f"✅ Finished speaking")
-                    
-            except Exception as e:
-                self.logger.error(f"TTS error: {e}")
-                print(f"❌ TTS error: {e}")
-    
-    def _speak_windows(self, text: str):
-        """Speak text using Windows SAPI"""
-        import win32com.client
-        speaker = win32com.client.Dispatch("SAPI.SpVoice")
-        
-        # Detect if text contains Chinese characters
-        is_chinese = self._contains_chinese(text)
-        if is_chinese:
-            voice_name = self.tts_config.get('chinese_voice_name', 'Microsoft Huihui Desktop')
-        else:
-            voice_name = self.tts_config.get('voice_name')
-        
-        # Try to find and set the voice by name
-        if voice_name:
-            voices = speaker.GetVoices()
-            for i in range(voices.Count):
-                voice = voices.Item(i)
-                if voice_name in voice.GetDescription():
-                    speaker.Voice = voice
-                    self.logger.info(f"Using voice: {voice.GetDescription()}")
-                    break
-        
-        # Configure voice settings
-        rate = self.tts_config.get('rate', 150)
-        volume = self.tts_config.get('volume', 0.9)
-        
-        # SAPI rate is -10 to 10, pyttsx3 is ~100-200
-        # Convert: pyttsx3 150 = SAPI 0
-        sapi_rate = int((rate - 150) / 15)  # -10 to 10 range
-        sapi_rate = max(-10, min(10, sapi_rate))
-        
-        speaker.Rate = sapi_rate
-        speaker.Volume = int(volume * 100)  # 0-100
-        
-        # Speak (this is synchronous)
-        self.logger.info(f"Using Windows SAPI for {'Chinese' if is_chinese else 'English'} text")
-        speaker.Speak(text)
-    
-    def _speak_linux(self, text: str):
-        """Speak text using Linux TTS (gTTS for better quality voices)"""
-        # Use gTTS for both Chinese and English for better quality
-        if self._contains_chinese(text):
-            # Use gTTS for Chinese text
-            self.logger.info("Using gTTS for Chinese text")
-            lang = 'zh-CN'
-        else:
-            # Use gTTS for English text with better female voice
-            self.logger.info("Using gTTS for English text")
-            lang = 'en'
-        
-        try:
-            tts = gTTS(text=text, lang=lang, slow=False)
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                temp_file = fp.name
-                tts.save(temp_file)
-            
-            # Play the audio file using pygame
-            try:
-                pygame.mixer.music.load(temp_file)
-                volume = self.tts_config.get('volume', 0.9)
-                pygame.mixer.music.set_volume(volume)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(10)
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-        except Exception as e:
-            self.logger.error(f"gTTS error: {e}, falling back to pyttsx3")
-            # Fallback to pyttsx3 if gTTS fails
-            rate = self.tts_config.get('rate', 150)
-            volume = self.tts_config.get('volume', 0.9)
-            
-            self.tts_engine.setProperty('rate', rate)
-            self.tts_engine.setProperty('volume', volume)
-            
-            # Speak (synchronous)
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
-    
-    def speak_async(self, text: str):
-        """Speak text asynchronously, interrupting any current speech"""
-        self.stop_speaking()  # Interrupt any ongoing TTS
-        thread = threading.Thread(
-            target=self._speak,
-            args=(text,),
-            daemon=True
-        )
-        thread.start()
-    
-    def test_alarm(self):
-        """Test the alarm system"""
-        self.logger.info("Testing alarm system")
-        self._speak("Alarm system test")
-        if self.alarm_sound:
-            self.alarm_sound.play()
-    
-    def cleanup(self):
-        """Cleanup resources"""
-        self.stop_alarm()
-        pygame.mixer.quit()
-        if self.tts_engine:
-            try:
-                self.tts_engine.endLoop()
-                self.tts_engine.stop()
-            except:
-                pass
+"""
+Alarm System Module
+Handles alarm sounds and Text-to-Speech
+"""
+import functools
+import hashlib
+import io
+import os
+import re
+import sys
+import platform
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from datetime import datetime
+import pygame
+import pyttsx3
+from event_fetcher import Event
+
+# CJK Unified Ideographs - compiled once so detection runs in the regex
+# engine instead of a per-character Python loop
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# Console banner ribbon, built once instead of '='*60 per print
+_RIBBON = '=' * 60
+
+# Sentence boundaries used to pipeline gTTS synthesis with playback
+_SENTENCE_RE = re.compile(r'(?<=[.!?。！？])\s+')
+
+# Most-recent synthesized utterances kept in memory (a repeating reminder
+# cycles through only a handful of phrases)
+_TTS_MEM_CACHE_MAX = 16
+
+
+def _split_sentences(text: str):
+    """Split text into sentences for pipelined synthesis.
+
+    Short utterances are kept whole - splitting only pays off when there
+    is enough audio to hide the synthesis of the next sentence behind.
+    """
+    if len(text) < 120:
+        return [text]
+    return [part for part in _SENTENCE_RE.split(text) if part.strip()]
+
+
+class AlarmSystem:
+    def stop_speaking(self):
+        """Interrupt any ongoing TTS playback (gTTS/pygame or pyttsx3)"""
+        # Interrupt gTTS/pygame playback
+        self._playback_interrupt.set()
+        try:
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
+        # Interrupt pyttsx3 playback
+        if self.tts_engine:
+            try:
+                self.tts_engine.stop()
+            except Exception:
+                pass
+
+    """Manages alarm sounds and text-to-speech notifications"""
+    
+    def __init__(self, config: dict, display_manager=None):
+        self.config = config
+        self.alarm_config = config['alarm']
+        self.tts_config = config['tts']
+        self.logger = logging.getLogger(__name__)
+        
+        # Reference to display manager for showing speech text
+        self.display_manager = display_manager
+        
+        # Detect OS for TTS method selection
+        self.is_windows = platform.system() == 'Windows'
+        self.logger.info("Running on %s, using %s", platform.system(),
+                         'Windows SAPI' if self.is_windows else 'Linux TTS')
+        
+        # On-disk cache for synthesized gTTS audio (survives restarts)
+        self._tts_cache_dir = os.path.expanduser('~/.cache/aireminder/tts')
+        try:
+            os.makedirs(self._tts_cache_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.warning("Could not create TTS cache dir: %s", e)
+            self._tts_cache_dir = None
+
+        # In-memory layer over the disk cache, bounded so long sessions
+        # don't accumulate audio (dict keeps insertion order for eviction)
+        self._tts_mem_cache = {}
+
+        # Mixer init is deferred to first use (_ensure_mixer): probing the
+        # audio backend takes 50-200 ms and holds the device open, which is
+        # wasted when the alarm is TTS-only with no sound file configured
+        self.alarm_sound = None
+        self._load_alarm_sound()
+        
+        # Initialize TTS engine
+        self.tts_engine = self._init_tts()
+
+        # Persistent SAPI voice (Windows only) - dispatched once, reused per utterance
+        self._sapi = None
+        self._english_voice = None
+        self._chinese_voice = None
+        if self.is_windows:
+            self._init_sapi()
+
+        # TTS lock to prevent concurrent access
+        self.tts_lock = threading.Lock()
+
+        # Set by stop_speaking to break out of a playback wait immediately
+        self._playback_interrupt = threading.Event()
+
+        # Single synthesizer thread: prefetches the next sentence's MP3
+        # while the current one is playing (see _speak_linux)
+        self._synth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts-synth')
+
+        # One long-lived speech worker instead of a new thread per
+        # speak_async call - thread startup costs more than an enqueue,
+        # and a single consumer also serializes utterances for free.
+        # SimpleQueue puts are reentrant C-level operations with no
+        # Python-side lock to contend on.
+        self._speak_queue = queue.SimpleQueue()
+        self._speak_worker = threading.Thread(
+            target=self._speak_worker_loop,
+            daemon=True,
+            name='tts-speak'
+        )
+        self._speak_worker.start()
+        
+        # State
+        self.is_playing = False
+        self.alarm_thread: Optional[threading.Thread] = None
+        self.stop_flag = threading.Event()
+        self.current_event: Optional[Event] = None
+        self.last_voice_reminder = None
+        
+    def _ensure_mixer(self):
+        """Initialize the pygame mixer on first use - match the format of the
+        bundled alarm WAV (see setup.py) so pygame doesn't resample on play"""
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
+
+    def _load_alarm_sound(self):
+        """Load the alarm sound file"""
+        sound_file = self.alarm_config.get('sound_file')
+        if sound_file and os.path.exists(sound_file):
+            try:
+                self._ensure_mixer()
+                self.alarm_sound = pygame.mixer.Sound(sound_file)
+                volume = self.alarm_config.get('volume', 0.8)
+                self.alarm_sound.set_volume(volume)
+                self.logger.info("Loaded alarm sound: %s", sound_file)
+            except Exception as e:
+                self.logger.error("Failed to load alarm sound: %s", e)
+        else:
+            self.logger.warning("No alarm sound file configured or file not found")
+    
+    def _init_tts(self) -> pyttsx3.Engine:
+        """Initialize text-to-speech engine"""
+        try:
+            engine = pyttsx3.init(debug=False)
+            
+            # Configure voice
+            rate = self.tts_config.get('rate', 150)
+            volume = self.tts_config.get('volume', 0.9)
+            voice_id = self.tts_config.get('voice')
+            
+            engine.setProperty('rate', rate)
+            engine.setProperty('volume', volume)
+            # Remember what the engine is set to - setProperty goes through
+            # the espeak driver, so callers skip it when nothing changed
+            self._pyttsx3_settings = (rate, volume)
+
+            if voice_id:
+                engine.setProperty('voice', voice_id)
+            
+            # Don't start the loop - we'll use runAndWait() instead
+            # engine.startLoop(False)  # Removed to avoid "run loop already started" error
+            
+            self.logger.info("TTS engine initialized")
+            return engine
+            
+        except Exception as e:
+            self.logger.error("Failed to initialize TTS: %s", e)
+            self._pyttsx3_settings = (None, None)
+            return None
+    
+    def _init_sapi(self):
+        """Create a persistent SAPI voice and resolve configured voices once"""
+        try:
+            import win32com.client
+            self._sapi = win32com.client.Dispatch("SAPI.SpVoice")
+
+            # Enumerate voices once - each GetVoices/GetDescription is a COM
+            # round-trip - and index them by description, so later lookups
+            # (including settings updates) never touch COM again
+            voices = self._sapi.GetVoices()
+            self._sapi_voice_index = {
+                voice.GetDescription(): voice
+                for voice in (voices.Item(i) for i in range(voices.Count))
+            }
+
+            self._english_voice = self._find_sapi_voice(self.tts_config.get('voice_name'))
+            self._chinese_voice = self._find_sapi_voice(
+                self.tts_config.get('chinese_voice_name', 'Microsoft Huihui Desktop'))
+
+            # Rate/Volume persist on the COM object, so set them once here
+            self._apply_sapi_settings()
+            self.logger.info("SAPI voice initialized")
+        except Exception as e:
+            self.logger.error("Failed to initialize SAPI: %s", e)
+            self._sapi = None
+
+    def _find_sapi_voice(self, voice_name):
+        """Find an indexed SAPI voice object by (partial) description match"""
+        if not voice_name:
+            return None
+        # Exact name is a dict hit; otherwise fall back to a substring
+        # scan over the cached description strings
+        voice = self._sapi_voice_index.get(voice_name)
+        if voice is not None:
+            self.logger.info("Resolved voice: %s", voice_name)
+            return voice
+        for description, voice in self._sapi_voice_index.items():
+            if voice_name in description:
+                self.logger.info("Resolved voice: %s", description)
+                return voice
+        return None
+
+    def _apply_sapi_settings(self):
+        """Apply configured rate/volume to the persistent SAPI voice"""
+        rate = self.tts_config.get('rate', 150)
+        volume = self.tts_config.get('volume', 0.9)
+
+        # SAPI rate is -10 to 10, pyttsx3 is ~100-200
+        # Convert: pyttsx3 150 = SAPI 0
+        sapi_rate = int((rate - 150) / 15)  # -10 to 10 range
+        sapi_rate = max(-10, min(10, sapi_rate))
+
+        self._sapi.Rate = sapi_rate
+        self._sapi.Volume = int(volume * 100)  # 0-100
+
+    def update_tts_settings(self):
+        """Update TTS settings without reinitializing the engine"""
+        try:
+            if self.tts_engine:
+                rate = self.tts_config.get('rate', 150)
+                volume = self.tts_config.get('volume', 0.9)
+                
+                self.tts_engine.setProperty('rate', rate)
+                self.tts_engine.setProperty('volume', volume)
+                self._pyttsx3_settings = (rate, volume)
+
+                self.logger.info("TTS settings updated: rate=%s, volume=%s", rate, volume)
+
+            # Refresh the persistent SAPI voice too - it is reused across
+            # utterances, so settings changes must be pushed onto it here
+            if self._sapi is not None:
+                self._apply_sapi_settings()
+                self._english_voice = self._find_sapi_voice(self.tts_config.get('voice_name'))
+                self._chinese_voice = self._find_sapi_voice(
+                    self.tts_config.get('chinese_voice_name', 'Microsoft Huihui Desktop'))
+        except Exception as e:
+            self.logger.error("Failed to update TTS settings: %s", e)
+    
+    def trigger_alarm(self, event: Event):
+        """Trigger an alarm for an event"""
+        if self.is_playing:
+            self.logger.warning("Alarm already playing")
+            return
+        
+        self.logger.info("Triggering alarm for event: %s", event.title)
+        self.is_playing = True
+        self.stop_flag.clear()
+
+        # Event details are fixed for the lifetime of the alarm, so
+        # specialize the announcement and banner strings here, once,
+        # rather than rebuilding anything per reminder in the loop.
+        # One utterance per announcement: a second _speak call would
+        # re-acquire the TTS lock and redo voice setup just to add an
+        # audible gap between title and description.
+        if event.description:
+            announcement = f"Reminder: {event.title}. {event.description}"
+        else:
+            announcement = f"Reminder: {event.title}"
+        event_lines = f"Event: {event.title}\nDescription: {event.description or 'None'}"
+
+        # Warm the TTS cache while the alarm thread spins up: the gTTS
+        # network fetch for the (fixed) announcement starts now, and every
+        # repeat of this alarm then plays from cache
+        if not self.is_windows:
+            lang = 'zh-CN' if self._contains_chinese(announcement) else 'en'
+            for part in _split_sentences(announcement):
+                self._synth_executor.submit(self._synthesize_mp3, part, lang)
+
+        # Start alarm in separate thread
+        self.alarm_thread = threading.Thread(
+            target=self._alarm_loop,
+            args=(event, announcement, event_lines),
+            daemon=True
+        )
+        self.alarm_thread.start()
+
+    def _alarm_loop(self, event: Event, announcement: str, event_lines: str):
+        """Main alarm loop (runs in separate thread)"""
+        try:
+            self.current_event = event
+            start_time = datetime.now()  # wall clock, for human-readable banners only
+            self.last_voice_reminder = start_time
+
+            # All interval arithmetic uses the monotonic clock: no object
+            # allocations per check, and immune to NTP/wall-clock jumps
+            start_mono = time.monotonic()
+            last_voice_mono = start_mono
+
+            # Initial announcement (single write instead of seven prints)
+            print(f"\n{_RIBBON}\n🔔 VOICE REMINDER TRIGGERED\n{_RIBBON}\n"
+                  f"{event_lines}\n"
+                  f"Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n{_RIBBON}\n")
+
+            self.logger.debug("About to speak announcement...")
+            self._speak(announcement)
+            self.logger.debug("Initial announcement complete")
+            
+            # Get intervals
+            sound_repeat_interval = self.alarm_config.get('repeat_interval', 30)
+            voice_reminder_interval = self.alarm_config.get('voice_reminder_interval', 300)
+            auto_stop_after = self.alarm_config.get('auto_stop_after', 1800)
+            
+            self.logger.debug("Loop settings: voice_interval=%ss, auto_stop=%ss", voice_reminder_interval, auto_stop_after)
+
+            # Absolute deadlines: one wakeup per reminder instead of
+            # re-deriving "time since" deltas on every pass
+            auto_stop_at = start_mono + auto_stop_after
+            next_voice_at = last_voice_mono + voice_reminder_interval
+
+            while not self.stop_flag.is_set():
+                now_mono = time.monotonic()
+                elapsed = now_mono - start_mono
+
+                # Check auto-stop timeout
+                if now_mono >= auto_stop_at:
+                    self.logger.info("Alarm auto-stopped after timeout")
+                    print(f"\n⏰ Auto-stopped after {auto_stop_after}s\n")
+                    break
+
+                # Check if voice reminder is due
+                self.logger.debug("Next voice reminder in %ds", next_voice_at - now_mono)
+
+                if now_mono >= next_voice_at:
+                    self.logger.info("Voice reminder due (every %ss)", voice_reminder_interval)
+
+                    # The repeat banner is a debug aid, not UI - skip the
+                    # strftime and f-string formatting entirely unless
+                    # debug logging is enabled
+                    now = datetime.now()
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        print(f"\n{_RIBBON}\n🔁 REPEATING VOICE REMINDER\n{_RIBBON}\n"
+                              f"{event_lines}\n"
+                              f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                              f"Elapsed: {int(elapsed)}s\n"
+                              f"Next reminder in: {voice_reminder_interval}s\n{_RIBBON}\n")
+
+                    self._speak(announcement)
+                    self.last_voice_reminder = now
+
+                    # Advance by the fixed increment so the cadence doesn't
+                    # drift by however long the announcement took; re-anchor
+                    # only if speaking outlasted a whole interval
+                    next_voice_at += voice_reminder_interval
+                    if next_voice_at <= time.monotonic():
+                        next_voice_at = time.monotonic() + voice_reminder_interval
+
+                # No beep sound - only voice reminders
+                if self.stop_flag.is_set():
+                    break
+
+                # Sleep until the earlier of the two deadlines, instead of
+                # waking up every 10 seconds just to poll.
+                # stop_flag.wait still returns immediately when the alarm is stopped.
+                sleep_for = min(next_voice_at, auto_stop_at) - time.monotonic()
+                if self.stop_flag.wait(max(0.1, sleep_for)):
+                    break
+            
+        except Exception as e:
+            self.logger.error("Error in alarm loop: %s", e)
+            print(f"\n❌ ERROR in alarm loop: {e}\n")
+        finally:
+            self.is_playing = False
+            self.current_event = None
+            self.last_voice_reminder = None
+            self.logger.info("Alarm stopped")
+            print(f"✅ Alarm loop finished\n")
+    
+    def stop_alarm(self):
+        """Stop the currently playing alarm"""
+        if not self.is_playing:
+            return
+        
+        self.logger.info("Stopping alarm")
+        self.stop_flag.set()
+        
+        # Stop any playing sounds
+        pygame.mixer.stop()
+        
+        # Wait for thread to finish
+        if self.alarm_thread and self.alarm_thread.is_alive():
+            self.alarm_thread.join(timeout=2)
+        
+        self.is_playing = False
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _contains_chinese(text: str) -> bool:
+        """Check if text contains Chinese characters"""
+        # str.isascii is a single C-level pass over the compact string
+        # representation, so it rejects the empty and English-only cases
+        # without even entering the regex engine. The lru_cache covers
+        # the repeating reminder re-checking the same announcement every
+        # interval - repeats become a dict lookup instead of a rescan.
+        if not text or text.isascii():
+            return False
+        return _CJK_RE.search(text) is not None
+    
+    def _speak(self, text: str):
+        """Speak text using TTS"""
+        if not self.tts_engine:
+            self.logger.warning("TTS engine not available")
+            return
+        
+        # Use lock to ensure only one TTS operation at a time
+        with self.tts_lock:
+            try:
+                # Single log line per utterance - the console handler echoes
+                # this, so a separate print would just duplicate the write
+                self.logger.info("Speaking: %s", text)
+
+
+                # Show text on GUI if display manager is available
+                if self.display_manager:
+                    self.display_manager.show_speaking_text(text)
+                
+                # Use Windows-specific TTS on Windows
+                if self.is_windows:
+                    self._speak_windows(text)
+                else:
+                    self._speak_linux(text)
+                
+                # Hide speaking text after speech completes
+                if self.display_manager:
+                    self.display_manager.hide_speaking_text()
+
+                self.logger.debug("Finished speaking")
+
+            except Exception as e:
+                self.logger.error("TTS error: %s", e)
+    
+    def _speak_windows(self, text: str):
+        """Speak text using Windows SAPI"""
+        if self._sapi is None:
+            self._init_sapi()
+        if self._sapi is None:
+            raise RuntimeError("SAPI voice not available")
+
+        # Detect if text contains Chinese characters and switch to the
+        # pre-resolved voice (no per-call GetVoices scan)
+        is_chinese = self._contains_chinese(text)
+        self.logger.info("Using Windows SAPI for %s text", 'Chinese' if is_chinese else 'English')
+        try:
+            self._sapi_speak(text, is_chinese)
+        except Exception as e:
+            # A dead COM proxy (audio device reset, SAPI service restart)
+            # would poison every later utterance - rebuild the cached
+            # objects once and retry before giving up
+            self.logger.warning("SAPI call failed (%s), reinitializing", e)
+            self._init_sapi()
+            if self._sapi is None:
+                raise
+            self._sapi_speak(text, is_chinese)
+
+    def _sapi_speak(self, text: str, is_chinese: bool):
+        """Speak through the persistent SAPI voice (cancellable)"""
+        voice = self._chinese_voice if is_chinese else self._english_voice
+        if voice is not None:
+            self._sapi.Voice = voice
+
+        # Speak asynchronously (1 = SVSFlagsAsync) and wait in 100 ms slices
+        # so stop_alarm can cancel mid-utterance instead of blocking for the
+        # whole synthesis
+        self._sapi.Speak(text, 1)
+        while not self._sapi.WaitUntilDone(100):
+            if self.stop_flag.is_set():
+                # 3 = SVSFlagsAsync | SVSFPurgeBeforeSpeak - flush pending audio
+                self._sapi.Speak('', 3)
+                break
+    
+    def _tts_cache_path(self, text: str, lang: str):
+        """Cache file path for a synthesized utterance, or None if no cache dir"""
+        if not self._tts_cache_dir:
+            return None
+        digest = hashlib.sha1(f"{lang}|{text}".encode('utf-8')).hexdigest()
+        return os.path.join(self._tts_cache_dir, digest + '.mp3')
+
+    def _synthesize_mp3(self, text: str, lang: str) -> io.BytesIO:
+        """Synthesize text to MP3 bytes, using the on-disk cache when possible.
+
+        pygame can stream straight from a file object, so the audio never
+        touches a temp file - gTTS writes into a BytesIO and the disk is
+        only involved for the persistent cache.
+        """
+        # Repeating reminders re-speak the same text every interval, so
+        # cache the synthesized MP3 - in memory for this session, on disk
+        # for repeats across restarts - and skip the HTTPS round-trip
+        # to Google whenever either layer hits
+        key = (lang, text)
+        cached = self._tts_mem_cache.get(key)
+        if cached is not None:
+            return io.BytesIO(cached)
+
+        mp3_path = self._tts_cache_path(text, lang)
+        if mp3_path is not None and os.path.exists(mp3_path):
+            self.logger.debug("gTTS cache hit for %r", text[:40])
+            with open(mp3_path, 'rb') as fp:
+                data = fp.read()
+            self._tts_mem_cache_put(key, data)
+            return io.BytesIO(data)
+
+        # Imported on first real synthesis: gtts drags in requests/urllib3
+        # and adds noticeably to startup on the Pi, and cache hits (and
+        # Windows, which speaks through SAPI) never need it at all
+        from gtts import gTTS
+
+        buf = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=False).write_to_fp(buf)
+        if mp3_path is not None:
+            try:
+                with open(mp3_path, 'wb') as fp:
+                    fp.write(buf.getvalue())
+            except OSError as e:
+                self.logger.warning("Could not write TTS cache file: %s", e)
+        self._tts_mem_cache_put(key, buf.getvalue())
+        return buf
+
+    def _tts_mem_cache_put(self, key, data: bytes):
+        """Remember synthesized audio, evicting the oldest entry when full"""
+        if len(self._tts_mem_cache) >= _TTS_MEM_CACHE_MAX:
+            self._tts_mem_cache.pop(next(iter(self._tts_mem_cache)))
+        self._tts_mem_cache[key] = data
+
+    def _play_mp3(self, mp3_buf: io.BytesIO):
+        """Play MP3 audio and block until playback finishes or is stopped"""
+        self._ensure_mixer()
+        mp3_buf.seek(0)
+        pygame.mixer.music.load(mp3_buf)
+        volume = self.tts_config.get('volume', 0.9)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play()
+
+        # Wait for playback to finish - a shared Event instead of
+        # allocating a pygame Clock per tick, and stop_speaking
+        # breaks the wait within one timeout slice
+        self._playback_interrupt.clear()
+        while pygame.mixer.music.get_busy():
+            if self._playback_interrupt.wait(0.1):
+                break
+
+    def _speak_linux(self, text: str):
+        """Speak text using Linux TTS (gTTS for better quality voices)"""
+        # Use gTTS for both Chinese and English for better quality
+        if self._contains_chinese(text):
+            # Use gTTS for Chinese text
+            self.logger.info("Using gTTS for Chinese text")
+            lang = 'zh-CN'
+        else:
+            # Use gTTS for English text with better female voice
+            self.logger.info("Using gTTS for English text")
+            lang = 'en'
+        
+        try:
+            # Pipeline synthesis and playback: split long text into
+            # sentences and let the synthesizer thread fetch sentence N+1
+            # while sentence N is playing, hiding the gTTS network latency
+            # behind the audio
+            parts = _split_sentences(text)
+            futures = [self._synth_executor.submit(self._synthesize_mp3, part, lang)
+                       for part in parts]
+            for future in futures:
+                self._play_mp3(future.result())
+                if self._playback_interrupt.is_set():
+                    break
+        except Exception as e:
+            self.logger.error("gTTS error: %s, falling back to pyttsx3", e)
+            # Fallback to pyttsx3 if gTTS fails
+            rate = self.tts_config.get('rate', 150)
+            volume = self.tts_config.get('volume', 0.9)
+
+            # Engine properties persist across utterances; only push them
+            # when the config actually changed since the last apply
+            if (rate, volume) != self._pyttsx3_settings:
+                self.tts_engine.setProperty('rate', rate)
+                self.tts_engine.setProperty('volume', volume)
+                self._pyttsx3_settings = (rate, volume)
+
+            # Speak (synchronous)
+            self.tts_engine.say(text)
+            self.tts_engine.runAndWait()
+    
+    def _speak_worker_loop(self):
+        """Consume queued utterances on the persistent speech thread"""
+        while True:
+            text = self._speak_queue.get()
+            if text is None:  # shutdown sentinel from cleanup()
+                break
+            try:
+                self._speak(text)
+            except Exception as e:
+                self.logger.error("Speech worker error: %s", e)
+
+    def speak_async(self, text: str):
+        """Speak text asynchronously, interrupting any current speech"""
+        # Drop anything still waiting - only the newest utterance matters
+        while True:
+            try:
+                self._speak_queue.get_nowait()
+            except queue.Empty:
+                break
+        self.stop_speaking()  # Interrupt any ongoing TTS
+        self._speak_queue.put(text)
+    
+    def test_alarm(self):
+        """Test the alarm system"""
+        self.logger.info("Testing alarm system")
+        self._speak("Alarm system test")
+        if self.alarm_sound:
+            self.alarm_sound.play()
+    
+    def cleanup(self):
+        """Cleanup resources"""
+        self.stop_alarm()
+        self._speak_queue.put(None)
+        self._synth_executor.shutdown(wait=False)
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        if self.tts_engine:
+            try:
+                self.tts_engine.endLoop()
+                self.tts_engine.stop()
+            except:
+                pass
@@ -2,8 +2,10 @@
 Chatbot Module
 Integrates with OpenAI GPT or Google Gemini for conversational AI
 """
+import itertools
 import logging
-from typing import Optional, List, Dict
+from collections import deque
+from typing import Deque, Optional, Dict
 from enum import Enum
 
 
@@ -31,8 +33,9 @@ class Chatbot:
         elif self.provider == ChatProvider.GEMINI:
             self._init_gemini()
         
-        # Conversation history
-        self.conversation_history: List[Dict[str, str]] = []
+        # Conversation history - deque evicts the oldest turn in O(1)
+        # instead of reslicing the whole list every exchange
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=20)
         
     def _init_openai(self):
         """Initialize OpenAI client"""
@@ -104,10 +107,6 @@ class Chatbot:
                         'role': 'assistant',
                         'content': response
                     })
-                    
-                    # Limit history size
-                    if len(self.conversation_history) > 20:
-                        self.conversation_history = self.conversation_history[-20:]
             
             return response
             
@@ -117,20 +116,23 @@ class Chatbot:
     
     def _chat_gemini(self, message: str, use_history: bool) -> Optional[str]:
         """Chat using Gemini (latest google-genai Client API)"""
-        # Build context from history (optional, can prepend to message)
-        context = ""
+        # Build structured contents instead of a flattened
+        # "User: ... / Assistant: ..." transcript - the API tokenizes the
+        # turns natively, so the "Previous conversation:" scaffolding and
+        # role-label prose no longer count against tokens-in
+        contents = []
         if use_history and self.conversation_history:
-            context = "Previous conversation:\n"
-            for msg in self.conversation_history[-10:]:
-                role = "User" if msg['role'] == 'user' else "Assistant"
-                context += f"{role}: {msg['content']}\n"
-            context += "\n"
-        prompt = f"{context}User: {message}\nAssistant:"
+            # deque doesn't slice; islice the last 10 without copying
+            start = max(0, len(self.conversation_history) - 10)
+            for msg in itertools.islice(self.conversation_history, start, None):
+                role = 'user' if msg['role'] == 'user' else 'model'
+                contents.append({'role': role, 'parts': [{'text': msg['content']}]})
+        contents.append({'role': 'user', 'parts': [{'text': message}]})
         try:
             # Use the latest API: client.models.generate_content
             # response = self.client.models.generate_content(
             #     model=getattr(self, 'gemini_model', 'models/gemini-2.5-flash'),
-            #     contents=prompt
+            #     contents=contents
             # )
             response = "Dummy response from LLM"
             return response.text.strip()
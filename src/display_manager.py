@@ -1,1222 +1,1813 @@
-"""
-Display Module
-Manages the GUI display using Tkinter
-"""
-import tkinter as tk
-from tkinter import ttk, font as tkfont
-from datetime import datetime
-from typing import List
-import logging
-from event_fetcher import Event
-
-
-class DisplayManager:
-    """Manages the GUI display for events"""
-    
-    def __init__(self, config: dict, secrets: dict = None):
-        self.full_config = config  # Store full config
-        self.secrets = secrets or {}  # Store secrets
-        self.config = config['display']
-        self.logger = logging.getLogger(__name__)
-        
-        # Create main window
-        self.root = tk.Tk()
-        self.root.title(self.config['window_title'])
-        self.root.geometry(f"{self.config['width']}x{self.config['height']}")
-        
-        if self.config.get('fullscreen', False):
-            self.root.attributes('-fullscreen', True)
-            self.root.bind('<Escape>', lambda e: self.root.attributes('-fullscreen', False))
-        
-        # Configure colors
-        self.bg_color = "#1a1a2e"
-        self.fg_color = "#eaeaea"
-        self.accent_color = "#16213e"
-        self.highlight_color = "#0f3460"
-        self.alarm_color = "#e94560"
-        
-        self.root.configure(bg=self.bg_color)
-        
-        # State - initialize before UI setup
-        self.events = []
-        self.is_alarm_active = False
-        
-        # News state
-        self.news_items = []
-        self.current_page = 0
-        self.items_per_page = 5
-        self.current_item_in_page = 0
-        self.auto_read_active = False
-        self.auto_read_on_tab_switch = True
-        self._pending_auto_advance = False
-        self._pending_speaking_text = None
-        self._pending_hide_speaking = False
-        
-        # Config state
-        self.config_entries = {}  # Store entry widgets for config
-        self.on_save_config_callback = None
-        
-        # Setup UI
-        self._setup_ui()
-        
-        # Start checking for pending auto-advance, speaking text, and voice recognition queue
-        self.root.after(100, self._check_pending_updates)
-        
-        self._news_cancel_token = 0  # Incremented to cancel all pending news actions
-        
-    def _setup_ui(self):
-        """Setup the UI components"""
-        # Header Frame
-        header_frame = tk.Frame(self.root, bg=self.accent_color, height=80)
-        header_frame.pack(fill=tk.X, pady=(0, 10))
-        header_frame.pack_propagate(False)
-        
-        # Title
-        title_font = tkfont.Font(family="Helvetica", size=24, weight="bold")
-        self.title_label = tk.Label(
-            header_frame,
-            text="🤖 AI Reminder System",
-            font=title_font,
-            bg=self.accent_color,
-            fg=self.fg_color
-        )
-        self.title_label.pack(side=tk.LEFT, padx=20, pady=15)
-        
-        # Clock
-        clock_font = tkfont.Font(family="Helvetica", size=18)
-        self.clock_label = tk.Label(
-            header_frame,
-            text="",
-            font=clock_font,
-            bg=self.accent_color,
-            fg=self.fg_color
-        )
-        self.clock_label.pack(side=tk.RIGHT, padx=20, pady=15)
-        
-        # Status Frame
-        status_frame = tk.Frame(self.root, bg=self.bg_color)
-        status_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-        
-        status_font = tkfont.Font(family="Helvetica", size=12)
-        self.status_label = tk.Label(
-            status_frame,
-            text="🟢 System Ready",
-            font=status_font,
-            bg=self.bg_color,
-            fg="#4ecca3"
-        )
-        self.status_label.pack(side=tk.LEFT)
-        
-        # Stop Alarm Button (initially hidden)
-        button_font = tkfont.Font(family="Helvetica", size=12, weight="bold")
-        self.stop_button = tk.Button(
-            status_frame,
-            text="🛑 STOP ALARM",
-            font=button_font,
-            bg=self.alarm_color,
-            fg=self.fg_color,
-            activebackground="#c0392b",
-            activeforeground=self.fg_color,
-            relief=tk.RAISED,
-            bd=3,
-            padx=20,
-            pady=5,
-            cursor="hand2",
-            command=self._on_stop_button_click
-        )
-        # Button is hidden by default
-        self.on_stop_alarm_callback = None
-        
-        # Speaking Text Frame (for displaying current voice output)
-        self.speaking_frame = tk.Frame(self.root, bg=self.highlight_color, relief=tk.RAISED, bd=2)
-        self.speaking_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
-        self.speaking_frame.pack_forget()  # Hidden by default
-        
-        speaking_title_font = tkfont.Font(family="Helvetica", size=10, weight="bold")
-        speaking_title = tk.Label(
-            self.speaking_frame,
-            text="🔊 Speaking:",
-            font=speaking_title_font,
-            bg=self.highlight_color,
-            fg="#4ecca3"
-        )
-        speaking_title.pack(anchor=tk.W, padx=10, pady=(5, 0))
-        
-        speaking_text_font = tkfont.Font(family="Helvetica", size=12)
-        self.speaking_label = tk.Label(
-            self.speaking_frame,
-            text="",
-            font=speaking_text_font,
-            bg=self.highlight_color,
-            fg=self.fg_color,
-            anchor=tk.W,
-            justify=tk.LEFT,
-            wraplength=self.config['width'] - 60
-        )
-        self.speaking_label.pack(fill=tk.X, padx=10, pady=(0, 10))
-        
-        # Main Content Area with Tabs
-        content_frame = tk.Frame(self.root, bg=self.bg_color)
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
-        
-        # Create notebook (tabbed interface)
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('TNotebook', background=self.bg_color, borderwidth=0)
-        style.configure('TNotebook.Tab', 
-                       background=self.accent_color, 
-                       foreground=self.fg_color,
-                       padding=[20, 10],
-                       font=('Helvetica', 11, 'bold'))
-        style.map('TNotebook.Tab',
-                 background=[('selected', self.highlight_color)],
-                 foreground=[('selected', '#4ecca3')])
-        
-        self.notebook = ttk.Notebook(content_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Events Tab
-        events_tab = tk.Frame(self.notebook, bg=self.bg_color)
-        self.notebook.add(events_tab, text="📅 Events")
-        
-        # Scrollable canvas for events
-        canvas = tk.Canvas(events_tab, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(events_tab, orient="vertical", command=canvas.yview)
-        
-        self.scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # News Tab
-        self._setup_news_tab()
-        
-        # Config Tab
-        self._setup_config_tab()
-        
-        # Switch to News tab by default (tab index 1)
-        self.notebook.select(1)
-        
-        # Update clock
-        self._update_clock()
-        
-        # Auto-refresh event statuses
-        self._auto_refresh_events()
-    
-    def _setup_news_tab(self):
-        """Setup the news tab"""
-        news_tab = tk.Frame(self.notebook, bg=self.bg_color)
-        self.notebook.add(news_tab, text="📰 News")
-        
-        # Control Frame
-        control_frame = tk.Frame(news_tab, bg=self.accent_color, height=60)
-        control_frame.pack(fill=tk.X, pady=(0, 10))
-        control_frame.pack_propagate(False)
-        
-        button_font = tkfont.Font(family="Helvetica", size=11, weight="bold")
-        
-        # Fetch News Button
-        self.fetch_news_button = tk.Button(
-            control_frame,
-            text="🔄 Fetch News",
-            font=button_font,
-            bg="#4ecca3",
-            fg=self.bg_color,
-            activebackground="#3dbb90",
-            relief=tk.RAISED,
-            bd=2,
-            padx=15,
-            pady=5,
-            cursor="hand2",
-            command=self._on_fetch_news_click
-        )
-        self.fetch_news_button.pack(side=tk.LEFT, padx=20, pady=10)
-        
-        # News counter label
-        self.news_counter_label = tk.Label(
-            control_frame,
-            text="No news loaded",
-            font=tkfont.Font(family="Helvetica", size=11),
-            bg=self.accent_color,
-            fg=self.fg_color
-        )
-        self.news_counter_label.pack(side=tk.LEFT, padx=10)
-        
-        # Page navigation label (right side)
-        self.page_label = tk.Label(
-            control_frame,
-            text="Page 0/0",
-            font=tkfont.Font(family="Helvetica", size=11, weight="bold"),
-            bg=self.accent_color,
-            fg=self.fg_color
-        )
-        self.page_label.pack(side=tk.RIGHT, padx=20)
-        
-        # News display area - scrollable frame for list of news
-        news_canvas = tk.Canvas(news_tab, bg=self.bg_color, highlightthickness=0)
-        news_scrollbar = ttk.Scrollbar(news_tab, orient="vertical", command=news_canvas.yview)
-        
-        self.news_scrollable_frame = tk.Frame(news_canvas, bg=self.bg_color)
-        self.news_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: news_canvas.configure(scrollregion=news_canvas.bbox("all"))
-        )
-        
-        news_canvas.create_window((0, 0), window=self.news_scrollable_frame, anchor="nw")
-        news_canvas.configure(yscrollcommand=news_scrollbar.set)
-        
-        news_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        news_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Initialize callbacks
-        self.on_fetch_news_callback = None
-        self.on_read_news_callback = None
-        
-        # Bind tab change event
-        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
-    
-    def _setup_config_tab(self):
-        """Setup the configuration tab"""
-        config_tab = tk.Frame(self.notebook, bg=self.bg_color)
-        self.notebook.add(config_tab, text="⚙️ Config")
-        
-        # Control Frame
-        control_frame = tk.Frame(config_tab, bg=self.accent_color, height=60)
-        control_frame.pack(fill=tk.X, pady=(0, 10))
-        control_frame.pack_propagate(False)
-        
-        button_font = tkfont.Font(family="Helvetica", size=11, weight="bold")
-        
-        # Save Config Button
-        self.save_config_button = tk.Button(
-            control_frame,
-            text="💾 Save Configuration",
-            font=button_font,
-            bg="#4ecca3",
-            fg=self.bg_color,
-            activebackground="#3dbb90",
-            relief=tk.RAISED,
-            bd=2,
-            padx=15,
-            pady=5,
-            cursor="hand2",
-            command=self._on_save_config_click
-        )
-        self.save_config_button.pack(side=tk.LEFT, padx=20, pady=10)
-        
-        # Status label for save feedback
-        self.config_status_label = tk.Label(
-            control_frame,
-            text="",
-            font=tkfont.Font(family="Helvetica", size=11),
-            bg=self.accent_color,
-            fg="#4ecca3"
-        )
-        self.config_status_label.pack(side=tk.LEFT, padx=10)
-        
-        # Scrollable config area
-        config_canvas = tk.Canvas(config_tab, bg=self.bg_color, highlightthickness=0)
-        config_scrollbar = ttk.Scrollbar(config_tab, orient="vertical", command=config_canvas.yview)
-        
-        self.config_scrollable_frame = tk.Frame(config_canvas, bg=self.bg_color)
-        self.config_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: config_canvas.configure(scrollregion=config_canvas.bbox("all"))
-        )
-        
-        config_canvas.create_window((0, 0), window=self.config_scrollable_frame, anchor="nw")
-        config_canvas.configure(yscrollcommand=config_scrollbar.set)
-        
-        config_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        config_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Build config form
-        self._build_config_form()
-        
-    def _build_config_form(self):
-        """Build the configuration form"""
-        form_font = tkfont.Font(family="Helvetica", size=10)
-        label_font = tkfont.Font(family="Helvetica", size=10, weight="bold")
-        section_font = tkfont.Font(family="Helvetica", size=12, weight="bold")
-        
-        # API Keys Section
-        self._add_section_header("🔑 API Keys", section_font)
-        self._add_config_field("OpenAI API Key", "openai_api_key", 
-                              self.secrets.get('openai_api_key', ''),
-                              label_font, form_font, is_secret=True)
-        self._add_config_field("Gemini API Key", "gemini_api_key",
-                              self.secrets.get('gemini_api_key', ''),
-                              label_font, form_font, is_secret=True)
-        
-        self._add_spacer()
-        
-        # TTS Configuration Section
-        self._add_section_header("🔊 Text-to-Speech", section_font)
-        tts_config = self.full_config.get('tts', {})
-        self._add_config_field("Speech Rate (100-200)", "tts.rate",
-                              str(tts_config.get('rate', 140)),
-                              label_font, form_font)
-        self._add_config_field("Volume (0.0-1.0)", "tts.volume",
-                              str(tts_config.get('volume', 0.9)),
-                              label_font, form_font)
-        self._add_config_field("English Voice Name", "tts.voice_name",
-                              tts_config.get('voice_name', 'Microsoft Zira Desktop'),
-                              label_font, form_font)
-        self._add_config_field("Chinese Voice Name", "tts.chinese_voice_name",
-                              tts_config.get('chinese_voice_name', 'Microsoft Huihui Desktop'),
-                              label_font, form_font)
-        
-        self._add_spacer()
-        
-        # Alarm Configuration Section
-        self._add_section_header("⏰ Alarm Settings", section_font)
-        alarm_config = self.full_config.get('alarm', {})
-        self._add_config_field("Voice Reminder Interval (seconds)", "alarm.voice_reminder_interval",
-                              str(alarm_config.get('voice_reminder_interval', 10)),
-                              label_font, form_font)
-        self._add_config_field("Auto Stop After (seconds)", "alarm.auto_stop_after",
-                              str(alarm_config.get('auto_stop_after', 1800)),
-                              label_font, form_font)
-        
-        self._add_spacer()
-        
-        # Chatbot Configuration Section
-        self._add_section_header("🤖 Chatbot", section_font)
-        chatbot_config = self.full_config.get('chatbot', {})
-        self._add_config_field("Provider (openai/gemini)", "chatbot.provider",
-                              chatbot_config.get('provider', 'openai'),
-                              label_font, form_font)
-        
-        openai_config = chatbot_config.get('openai', {})
-        self._add_config_field("OpenAI Model", "chatbot.openai.model",
-                              openai_config.get('model', 'gpt-3.5-turbo'),
-                              label_font, form_font)
-        
-        gemini_config = chatbot_config.get('gemini', {})
-        self._add_config_field("Gemini Model", "chatbot.gemini.model",
-                              gemini_config.get('model', 'gemini-pro'),
-                              label_font, form_font)
-        
-        self._add_spacer()
-        
-        # News Configuration Section
-        self._add_section_header("📰 News Feeds", section_font)
-        news_config = self.full_config.get('news', {})
-        self._add_config_field("Max Items Per Feed", "news.max_items_per_feed",
-                              str(news_config.get('max_items_per_feed', 5)),
-                              label_font, form_font)
-        
-        # All available news feeds (predefined list)
-        all_feeds = {
-            "BBC News": "http://feeds.bbci.co.uk/news/rss.xml",
-            "CNN": "http://rss.cnn.com/rss/edition.rss",
-            "Reuters": "https://www.reutersagency.com/feed/?taxonomy=best-topics&post_type=best",
-            "TechCrunch": "https://techcrunch.com/feed/",
-            "The Guardian": "https://www.theguardian.com/world/rss",
-            "China Daily": "http://www.chinadaily.com.cn/rss/world_rss.xml",
-            "Xinhua English": "http://www.news.cn/english/rss/englishrssnew.xml",
-            "CGTN": "https://www.cgtn.com/rss/news.xml",
-            "South China Morning Post": "https://www.scmp.com/rss/91/feed",
-            "中新网即时新闻": "https://www.chinanews.com.cn/rss/scroll-news.xml"
-        }
-        
-        # Current active feeds from config
-        active_feeds = news_config.get('feeds', {})
-        
-        # Add checkboxes for each feed
-        self._add_news_feed_checkboxes(all_feeds, active_feeds, label_font)
-        
-        # Add custom feed input
-        self._add_custom_feed_input(active_feeds, all_feeds, label_font, form_font)
-        
-    def _add_news_feed_checkboxes(self, all_feeds, active_feeds, label_font):
-        """Add checkboxes for news feeds"""
-        self.feed_checkboxes = {}
-        
-        feeds_label = tk.Label(
-            self.config_scrollable_frame,
-            text="Select News Sources:",
-            font=label_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            anchor=tk.W
-        )
-        feeds_label.pack(fill=tk.X, padx=10, pady=(10, 5))
-        
-        # Create frame for checkboxes
-        checkbox_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
-        checkbox_frame.pack(fill=tk.X, padx=20, pady=5)
-        
-        for feed_name, feed_url in all_feeds.items():
-            var = tk.BooleanVar(value=feed_name in active_feeds)
-            
-            cb = tk.Checkbutton(
-                checkbox_frame,
-                text=feed_name,
-                variable=var,
-                bg=self.bg_color,
-                fg=self.fg_color,
-                selectcolor=self.accent_color,
-                activebackground=self.bg_color,
-                activeforeground=self.fg_color,
-                font=tkfont.Font(family="Helvetica", size=10),
-                anchor=tk.W
-            )
-            cb.pack(anchor=tk.W, pady=2)
-            
-            self.feed_checkboxes[feed_name] = {
-                'var': var,
-                'url': feed_url
-            }
-    
-    def _add_custom_feed_input(self, active_feeds, all_feeds, label_font, form_font):
-        """Add input fields for custom news feeds"""
-        custom_label = tk.Label(
-            self.config_scrollable_frame,
-            text="Add Custom Feed:",
-            font=label_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            anchor=tk.W
-        )
-        custom_label.pack(fill=tk.X, padx=10, pady=(15, 5))
-        
-        # Custom feed container
-        custom_frame = tk.Frame(self.config_scrollable_frame, bg=self.accent_color, relief=tk.RAISED, bd=2)
-        custom_frame.pack(fill=tk.X, padx=20, pady=5)
-        
-        # Feed name input
-        name_row = tk.Frame(custom_frame, bg=self.accent_color)
-        name_row.pack(fill=tk.X, padx=10, pady=(10, 5))
-        
-        name_label = tk.Label(
-            name_row,
-            text="Feed Name:",
-            font=form_font,
-            bg=self.accent_color,
-            fg=self.fg_color,
-            width=15,
-            anchor=tk.W
-        )
-        name_label.pack(side=tk.LEFT, padx=(0, 5))
-        
-        self.custom_feed_name = tk.Entry(
-            name_row,
-            font=form_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
-            relief=tk.FLAT
-        )
-        self.custom_feed_name.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=3)
-        
-        # Feed URL input
-        url_row = tk.Frame(custom_frame, bg=self.accent_color)
-        url_row.pack(fill=tk.X, padx=10, pady=(5, 5))
-        
-        url_label = tk.Label(
-            url_row,
-            text="Feed URL:",
-            font=form_font,
-            bg=self.accent_color,
-            fg=self.fg_color,
-            width=15,
-            anchor=tk.W
-        )
-        url_label.pack(side=tk.LEFT, padx=(0, 5))
-        
-        self.custom_feed_url = tk.Entry(
-            url_row,
-            font=form_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
-            relief=tk.FLAT
-        )
-        self.custom_feed_url.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=3)
-        
-        # Add button
-        add_button = tk.Button(
-            custom_frame,
-            text="➕ Add Feed",
-            font=tkfont.Font(family="Helvetica", size=10, weight="bold"),
-            bg="#4ecca3",
-            fg=self.bg_color,
-            activebackground="#3dbb90",
-            relief=tk.RAISED,
-            bd=2,
-            padx=10,
-            pady=3,
-            cursor="hand2",
-            command=self._on_add_custom_feed
-        )
-        add_button.pack(pady=(5, 10))
-        
-        # List of custom feeds
-        self.custom_feeds_listbox_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
-        self.custom_feeds_listbox_frame.pack(fill=tk.X, padx=20, pady=(5, 10))
-        
-        # Store custom feeds added during session
-        self.custom_feeds_list = []
-        self._load_custom_feeds(active_feeds, all_feeds)
-    
-    def _load_custom_feeds(self, active_feeds, predefined_feeds):
-        """Load custom feeds that are not in the predefined list"""
-        for feed_name, feed_url in active_feeds.items():
-            if feed_name not in predefined_feeds:
-                self._add_custom_feed_to_list(feed_name, feed_url)
-    
-    def _on_add_custom_feed(self):
-        """Handle adding a custom feed"""
-        name = self.custom_feed_name.get().strip()
-        url = self.custom_feed_url.get().strip()
-        
-        if name and url:
-            self._add_custom_feed_to_list(name, url)
-            
-            # Clear inputs
-            self.custom_feed_name.delete(0, tk.END)
-            self.custom_feed_url.delete(0, tk.END)
-        else:
-            # Show error message briefly
-            self.config_status_label.config(text="⚠️ Please enter both name and URL", fg="#e94560")
-            self.root.after(3000, lambda: self.config_status_label.config(text=""))
-    
-    def _add_custom_feed_to_list(self, name, url):
-        """Add a custom feed to the display list"""
-        feed_frame = tk.Frame(self.custom_feeds_listbox_frame, bg=self.accent_color, relief=tk.RAISED, bd=1)
-        feed_frame.pack(fill=tk.X, pady=2)
-        
-        var = tk.BooleanVar(value=True)
-        
-        cb = tk.Checkbutton(
-            feed_frame,
-            text=f"{name}",
-            variable=var,
-            bg=self.accent_color,
-            fg=self.fg_color,
-            selectcolor=self.bg_color,
-            activebackground=self.accent_color,
-            activeforeground=self.fg_color,
-            font=tkfont.Font(family="Helvetica", size=9),
-            anchor=tk.W
-        )
-        cb.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
-        
-        # Delete button
-        del_btn = tk.Button(
-            feed_frame,
-            text="🗑️",
-            bg=self.alarm_color,
-            fg=self.fg_color,
-            relief=tk.FLAT,
-            bd=0,
-            padx=5,
-            cursor="hand2",
-            command=lambda: self._remove_custom_feed(feed_frame, name)
-        )
-        del_btn.pack(side=tk.RIGHT, padx=5, pady=2)
-        
-        self.custom_feeds_list.append({
-            'name': name,
-            'url': url,
-            'var': var,
-            'frame': feed_frame
-        })
-    
-    def _remove_custom_feed(self, frame, name):
-        """Remove a custom feed from the list"""
-        frame.destroy()
-        self.custom_feeds_list = [f for f in self.custom_feeds_list if f['name'] != name]
-        
-    def _add_section_header(self, text, font):
-        """Add a section header"""
-        header = tk.Label(
-            self.config_scrollable_frame,
-            text=text,
-            font=font,
-            bg=self.bg_color,
-            fg="#4ecca3",
-            anchor=tk.W
-        )
-        header.pack(fill=tk.X, padx=10, pady=(15, 5))
-        
-        separator = tk.Frame(self.config_scrollable_frame, bg=self.highlight_color, height=2)
-        separator.pack(fill=tk.X, padx=10, pady=(0, 10))
-    
-    def _add_config_field(self, label_text, config_key, value, label_font, entry_font, is_secret=False):
-        """Add a configuration field"""
-        row_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
-        row_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        label = tk.Label(
-            row_frame,
-            text=label_text + ":",
-            font=label_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            width=30,
-            anchor=tk.W
-        )
-        label.pack(side=tk.LEFT, padx=(0, 10))
-        
-        entry = tk.Entry(
-            row_frame,
-            font=entry_font,
-            bg=self.accent_color,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
-            relief=tk.FLAT,
-            show="*" if is_secret else None
-        )
-        entry.insert(0, value)
-        entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5, padx=(0, 10))
-        
-        self.config_entries[config_key] = entry
-    
-    def _add_info_text(self, label_text, info_text, label_font, text_font):
-        """Add an informational text area"""
-        row_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
-        row_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        label = tk.Label(
-            row_frame,
-            text=label_text + ":",
-            font=label_font,
-            bg=self.bg_color,
-            fg=self.fg_color,
-            anchor=tk.NW
-        )
-        label.pack(anchor=tk.W, padx=(0, 10), pady=(0, 5))
-        
-        text_widget = tk.Text(
-            row_frame,
-            font=text_font,
-            bg=self.accent_color,
-            fg=self.fg_color,
-            height=6,
-            wrap=tk.WORD,
-            relief=tk.FLAT,
-            state=tk.DISABLED
-        )
-        text_widget.pack(fill=tk.X, expand=True)
-        
-        # Enable, insert text, then disable again
-        text_widget.config(state=tk.NORMAL)
-        text_widget.insert(1.0, info_text)
-        text_widget.config(state=tk.DISABLED)
-    
-    def _add_spacer(self):
-        """Add a spacer between sections"""
-        spacer = tk.Frame(self.config_scrollable_frame, bg=self.bg_color, height=10)
-        spacer.pack(fill=tk.X)
-    
-    def _on_save_config_click(self):
-        """Handle save config button click"""
-        if self.on_save_config_callback:
-            # Collect values from entries
-            config_values = {}
-            for key, entry in self.config_entries.items():
-                config_values[key] = entry.get()
-            
-            # Collect selected news feeds
-            news_feeds = {}
-            
-            # Add predefined feeds that are checked
-            for feed_name, feed_data in self.feed_checkboxes.items():
-                if feed_data['var'].get():
-                    news_feeds[feed_name] = feed_data['url']
-            
-            # Add custom feeds that are checked
-            for custom_feed in self.custom_feeds_list:
-                if custom_feed['var'].get():
-                    news_feeds[custom_feed['name']] = custom_feed['url']
-            
-            config_values['news.feeds'] = news_feeds
-            
-            self.on_save_config_callback(config_values)
-            self.config_status_label.config(text="✅ Configuration saved!", fg="#4ecca3")
-            # Clear status after 3 seconds
-            self.root.after(3000, lambda: self.config_status_label.config(text=""))
-        
-    def set_config_callback(self, callback):
-        """Set callback for config save"""
-        self.on_save_config_callback = callback
-        
-    def _auto_refresh_events(self):
-        """Auto-refresh events display to update statuses"""
-        if self.events:
-            self._refresh_events_display()
-        # Refresh every 30 seconds
-        self.root.after(30000, self._auto_refresh_events)
-        
-    def _update_clock(self):
-        """Update the clock display"""
-        now = datetime.now()
-        time_str = now.strftime("%H:%M:%S")
-        date_str = now.strftime("%A, %B %d, %Y")
-        self.clock_label.config(text=f"{time_str}\n{date_str}")
-        self.root.after(1000, self._update_clock)
-        
-    def update_events(self, events: List[Event]):
-        """Update the events display"""
-        self.events = events
-        self._refresh_events_display()
-        
-    def _refresh_events_display(self):
-        """Refresh the events list on screen"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.events:
-            no_events_label = tk.Label(
-                self.scrollable_frame,
-                text="📭 No events scheduled for today",
-                font=tkfont.Font(family="Helvetica", size=16),
-                bg=self.bg_color,
-                fg=self.fg_color,
-                pady=50
-            )
-            no_events_label.pack()
-            return
-        
-        # Sort events by time
-        sorted_events = sorted(self.events, key=lambda e: e.event_time)
-        
-        for event in sorted_events:
-            self._create_event_widget(event)
-    
-    def _create_event_widget(self, event: Event):
-        """Create a widget for a single event"""
-        now = datetime.now()
-        time_diff = (event.event_time - now).total_seconds()
-        
-        # Determine event status
-        # In Progress: within 60 minutes after event time
-        is_in_progress = -3600 <= time_diff <= 0  # 0 to -60 minutes
-        # Expired/Completed: more than 60 minutes past
-        is_expired = time_diff < -3600
-        # Upcoming Soon: within 5 minutes before
-        is_soon = 0 < time_diff <= 300
-        # Future: more than 5 minutes away
-        is_future = time_diff > 300
-        
-        # Determine status text and emoji
-        if event.triggered:
-            status_text = "COMPLETED"
-            status_emoji = "✓"
-            status_color = "#4ecca3"
-        elif is_in_progress:
-            status_text = "IN PROGRESS"
-            status_emoji = "▶"
-            status_color = "#f39c12"
-        elif is_expired:
-            status_text = "EXPIRED"
-            status_emoji = "✗"
-            status_color = "#666666"
-        elif is_soon:
-            status_text = "STARTING SOON"
-            status_emoji = "🔔"
-            status_color = self.alarm_color
-        else:
-            status_text = "UPCOMING"
-            status_emoji = "📅"
-            status_color = "#3498db"
-        
-        # Choose colors based on status
-        if event.triggered or is_expired:
-            bg = self.bg_color
-            fg = "#666666"
-            border_color = "#444444"
-        elif is_in_progress:
-            bg = "#f39c12"
-            fg = self.fg_color
-            border_color = "#f39c12"
-        elif is_soon:
-            bg = self.highlight_color
-            fg = self.fg_color
-            border_color = self.alarm_color
-        else:
-            bg = self.accent_color
-            fg = self.fg_color
-            border_color = self.accent_color
-        
-        # Event frame
-        event_frame = tk.Frame(
-            self.scrollable_frame,
-            bg=border_color,
-            padx=2,
-            pady=2
-        )
-        event_frame.pack(fill=tk.X, pady=5)
-        
-        inner_frame = tk.Frame(event_frame, bg=bg, padx=15, pady=10)
-        inner_frame.pack(fill=tk.BOTH)
-        
-        # Time
-        time_font = tkfont.Font(family="Helvetica", size=16, weight="bold")
-        time_label = tk.Label(
-            inner_frame,
-            text=event.event_time.strftime("%H:%M"),
-            font=time_font,
-            bg=bg,
-            fg=fg
-        )
-        time_label.pack(side=tk.LEFT, padx=(0, 15))
-        
-        # Event details
-        details_frame = tk.Frame(inner_frame, bg=bg)
-        details_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        title_font = tkfont.Font(family="Helvetica", size=14, weight="bold")
-        title_label = tk.Label(
-            details_frame,
-            text=f"{status_emoji} {event.title}",
-            font=title_font,
-            bg=bg,
-            fg=fg,
-            anchor="w"
-        )
-        title_label.pack(fill=tk.X)
-        
-        # Status badge
-        status_font = tkfont.Font(family="Helvetica", size=9, weight="bold")
-        status_label = tk.Label(
-            details_frame,
-            text=f"● {status_text}",
-            font=status_font,
-            bg=bg,
-            fg=status_color,
-            anchor="w"
-        )
-        status_label.pack(fill=tk.X)
-        
-        if event.description:
-            desc_font = tkfont.Font(family="Helvetica", size=11)
-            desc_label = tk.Label(
-                details_frame,
-                text=event.description,
-                font=desc_font,
-                bg=bg,
-                fg=fg,
-                anchor="w",
-                wraplength=500
-            )
-            desc_label.pack(fill=tk.X)
-    
-    def show_alarm(self, event: Event):
-        """Show alarm notification"""
-        self.is_alarm_active = True
-        self.status_label.config(
-            text=f"🔔 ALARM: {event.title}",
-            fg=self.alarm_color
-        )
-        # Show stop button
-        self.stop_button.pack(side=tk.RIGHT, padx=20)
-        self._refresh_events_display()
-        
-    def clear_alarm(self):
-        """Clear alarm notification"""
-        self.is_alarm_active = False
-        self.status_label.config(
-            text="🟢 System Ready",
-            fg="#4ecca3"
-        )
-        # Hide stop button
-        self.stop_button.pack_forget()
-        self._refresh_events_display()
-    
-    def _on_stop_button_click(self):
-        """Handle stop button click"""
-        self.logger.info("Stop button clicked on HMI")
-        if self.on_stop_alarm_callback:
-            self.on_stop_alarm_callback()
-    
-    def set_stop_alarm_callback(self, callback):
-        """Set callback for stop alarm button"""
-        self.on_stop_alarm_callback = callback
-        
-    def update_status(self, message: str, color: str = "#4ecca3"):
-        """Update status message"""
-        self.status_label.config(text=message, fg=color)
-    
-    def show_speaking_text(self, text: str):
-        """Show text that is being spoken (thread-safe)"""
-        self._pending_speaking_text = text
-    
-    def hide_speaking_text(self):
-        """Hide speaking text display (thread-safe)"""
-        self._pending_hide_speaking = True
-    
-    # News Tab Methods
-    def set_news_callbacks(self, fetch_callback, read_callback):
-        """Set callbacks for news functions"""
-        self.on_fetch_news_callback = fetch_callback
-        self.on_read_news_callback = read_callback
-    
-    def _on_fetch_news_click(self):
-        """Handle fetch news button click"""
-        self.logger.info("Fetch news button clicked")
-        if self.on_fetch_news_callback:
-            self.on_fetch_news_callback()
-    
-
-    
-    def update_news(self, news_items):
-        """Update news items and display first page"""
-        self.news_items = news_items
-        self.current_page = 0
-        self.current_item_in_page = 0
-        
-        if news_items:
-            total_pages = (len(news_items) + self.items_per_page - 1) // self.items_per_page
-            self.news_counter_label.config(text=f"Loaded {len(news_items)} news items")
-            self.page_label.config(text=f"Page {self.current_page + 1}/{total_pages}")
-            self._display_current_page()
-        else:
-            self.news_counter_label.config(text="No news loaded")
-            self.page_label.config(text="Page 0/0")
-            # Clear display
-            for widget in self.news_scrollable_frame.winfo_children():
-                widget.destroy()
-    
-    def _display_current_page(self):
-        """Display 5 news items for current page"""
-        # Clear previous content
-        for widget in self.news_scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.news_items:
-            no_news_label = tk.Label(
-                self.news_scrollable_frame,
-                text="No news items found. Click 'Fetch News' to load.",
-                font=tkfont.Font(family="Helvetica", size=12),
-                bg=self.bg_color,
-                fg=self.fg_color,
-                padx=20,
-                pady=20
-            )
-            no_news_label.pack()
-            return
-        
-        # Calculate which items to show
-        start_idx = self.current_page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.news_items))
-        
-        # Display items for current page
-        for i in range(start_idx, end_idx):
-            item = self.news_items[i]
-            self._create_news_item_widget(item, i - start_idx)
-    
-    def _create_news_item_widget(self, item, index_in_page):
-        """Create a widget for a single news item"""
-        # Item frame with border
-        item_frame = tk.Frame(
-            self.news_scrollable_frame,
-            bg="#0f3460",
-            padx=2,
-            pady=2
-        )
-        item_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        # Inner frame
-        inner_frame = tk.Frame(item_frame, bg=self.accent_color, padx=15, pady=15)
-        inner_frame.pack(fill=tk.BOTH)
-        
-        # Number badge
-        number_label = tk.Label(
-            inner_frame,
-            text=f"{index_in_page + 1}",
-            font=tkfont.Font(family="Helvetica", size=18, weight="bold"),
-            bg="#4ecca3",
-            fg=self.bg_color,
-            width=3,
-            height=2
-        )
-        number_label.pack(side=tk.LEFT, padx=(0, 15))
-        
-        # Content frame
-        content_frame = tk.Frame(inner_frame, bg=self.accent_color)
-        content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_label = tk.Label(
-            content_frame,
-            text=item.title,
-            font=tkfont.Font(family="Helvetica", size=14, weight="bold"),
-            bg=self.accent_color,
-            fg=self.fg_color,
-            anchor="w",
-            justify=tk.LEFT,
-            wraplength=600
-        )
-        title_label.pack(fill=tk.X, pady=(0, 10))
-        
-        # Description
-        desc_label = tk.Label(
-            content_frame,
-            text=item.description,
-            font=tkfont.Font(family="Helvetica", size=11),
-            bg=self.accent_color,
-            fg="#cccccc",
-            anchor="w",
-            justify=tk.LEFT,
-            wraplength=600
-        )
-        desc_label.pack(fill=tk.X)
-    
-    def _on_tab_changed(self, event):
-        """Handle tab change event (auto news fetch and auto-read disabled)"""
-        # Auto-fetch and auto-read are disabled. No action is taken when switching tabs.
-    
-    def start_auto_read(self):
-        """Start automatically reading news page by page"""
-        if not self.news_items or self.auto_read_active:
-            return
-        
-        self.auto_read_active = True
-        self.current_page = 0
-        self.current_item_in_page = 0
-        self._display_current_page()
-        self._read_current_item_auto()
-    
-    def stop_auto_read(self):
-        """Stop auto-reading"""
-        self.auto_read_active = False
-        self._pending_auto_advance = False
-        self._news_cancel_token += 1  # Invalidate all pending callbacks
-        self.logger.info("stop_auto_read: Cleared pending auto-advance, set auto_read_active to False, incremented cancel token")
-    
-    def _read_current_item_auto(self):
-        # FINAL GUARD: Do not read if auto_read_active is now False
-        if not self.auto_read_active:
-            self.logger.warning("_read_current_item_auto: Auto-read not active, aborting news read.")
-            return
-        if not self.news_items:
-            self.logger.warning(f"Cannot read: active={self.auto_read_active}, items=0")
-            return
-        # Calculate absolute index
-        abs_index = self.current_page * self.items_per_page + self.current_item_in_page
-        self.logger.info(f"Reading news at absolute index {abs_index} (page {self.current_page}, item {self.current_item_in_page})")
-        # Capture cancel token at scheduling time
-        cancel_token = self._news_cancel_token
-        if abs_index < len(self.news_items):
-            item = self.news_items[abs_index]
-            # GUARD: Do not invoke callback if auto_read_active is False or token changed
-            if self.on_read_news_callback and self.auto_read_active and cancel_token == self._news_cancel_token:
-                self.on_read_news_callback(item, auto_advance=True)
-            else:
-                self.logger.info("on_read_news_callback skipped: auto_read_active is False or cancel token changed")
-        else:
-            self.logger.error(f"Index {abs_index} out of range (total: {len(self.news_items)})")
-    
-    def schedule_auto_advance(self):
-        """Schedule auto advance from background thread (thread-safe)"""
-        if not self.auto_read_active:
-            self.logger.info("Auto-read not active, not scheduling auto-advance")
-            return
-        # Set a flag that will be checked by the GUI thread, and capture cancel token
-        self._pending_auto_advance = True
-        self._pending_auto_advance_token = self._news_cancel_token
-        self.logger.info("Set pending auto-advance flag with token %d", self._pending_auto_advance_token)
-    
-    def clear_pending_auto_advance(self):
-        """Clear any pending auto-advance flag immediately."""
-        self._pending_auto_advance = False
-        self.logger.info("Cleared pending auto-advance flag (stop called)")
-    
-    def _check_pending_updates(self):
-        """Check and process pending updates from background threads (called from GUI thread)"""
-        # Check for pending auto-advance
-        if hasattr(self, '_pending_auto_advance') and self._pending_auto_advance:
-            # Only process if token matches
-            if getattr(self, '_pending_auto_advance_token', None) == self._news_cancel_token:
-                self._pending_auto_advance = False
-                self.logger.info("Processing pending auto-advance (token valid)")
-                self.auto_advance_news()
-            else:
-                self._pending_auto_advance = False
-                self.logger.info("Skipped pending auto-advance: cancel token changed")
-
-        # Check for pending speaking text updates
-        if hasattr(self, '_pending_speaking_text') and self._pending_speaking_text is not None:
-            text = self._pending_speaking_text
-            self._pending_speaking_text = None
-            self.speaking_label.config(text=text)
-            self.speaking_frame.pack(fill=tk.X, padx=20, pady=(0, 10), after=self.status_label.master)
-
-        # Check for pending hide speaking text
-        if hasattr(self, '_pending_hide_speaking') and self._pending_hide_speaking:
-            self._pending_hide_speaking = False
-            self.speaking_frame.pack_forget()
-
-        # Process any recognized voice text from the audio queue (thread-safe)
-        if hasattr(self, 'voice_recognition') and hasattr(self.voice_recognition, 'process_pending_audio'):
-            # self.logger.info("[INFO] _check_pending_updates: voice_recognition and process_pending_audio present, calling it.")
-            self.voice_recognition.process_pending_audio()
-        else:
-            self.logger.info(f"[INFO] _check_pending_updates: voice_recognition present? {hasattr(self, 'voice_recognition')}, process_pending_audio present? {hasattr(getattr(self, 'voice_recognition', None), 'process_pending_audio')}")
-
-        # Check again after 100ms
-        self.root.after(100, self._check_pending_updates)
-    
-    def auto_advance_news(self):
-        """Advance to next news item within page, or next page after all items read"""
-        self.logger.info(f"auto_advance_news called: page={self.current_page}, item={self.current_item_in_page}, active={self.auto_read_active}")
-        if not self.auto_read_active:
-            self.logger.warning("Auto-read not active, stopping (pre-advance)")
-            return
-        # Double-check guard: if auto_read_active was set to False after pending flag, do not advance
-        if not getattr(self, 'auto_read_active', True):
-            self.logger.warning("Auto-read not active (double-check), aborting advance.")
-            return
-
-        # Move to next item in current page
-        self.current_item_in_page += 1
-        self.logger.info(f"Advanced to item {self.current_item_in_page}")
-
-        # Calculate how many items on current page
-        start_idx = self.current_page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.news_items))
-        items_on_page = end_idx - start_idx
-
-        # Check if we finished all items on current page
-        if self.current_item_in_page >= items_on_page:
-            # Move to next page
-            self.current_item_in_page = 0
-            self.current_page += 1
-
-            total_pages = (len(self.news_items) + self.items_per_page - 1) // self.items_per_page
-
-            # Loop back to first page if at end
-            if self.current_page >= total_pages:
-                self.current_page = 0
-                self.update_status("🔄 Looping back to first page", "#4ecca3")
-
-            # Update page display
-            self._display_current_page()
-            self.page_label.config(text=f"Page {self.current_page + 1}/{total_pages}")
-
-        # FINAL GUARD: Do not continue if auto_read_active is now False
-        if not self.auto_read_active:
-            self.logger.warning("Auto-read not active, stopping (post-advance guard)")
-            return
-
-        # Continue reading
-        self._read_current_item_auto()
-    
-    def run(self):
-        """Start the GUI main loop"""
-        self.root.mainloop()
-        
-    def update(self):
-        """Process pending GUI events"""
-        self.root.update()
+"""
+Display Module
+Manages the GUI display using Tkinter
+"""
+import _tkinter
+import tkinter as tk
+from tkinter import ttk, font as tkfont
+from typing import List
+import logging
+import operator
+import threading
+import time
+from types import MappingProxyType
+from event_fetcher import Event
+
+# Event rows rendered per event-loop pass during a refresh; big lists are
+# spread over several idle callbacks so input and painting stay responsive
+_REFRESH_CHUNK = 25
+
+# Most Tk events one update() pass will dispatch before yielding back to
+# the caller's loop; a burst (alarm storm, resize cascade) carries over
+# to the next pass instead of pinning this one
+_UPDATE_EVENT_BUDGET = 200
+
+# The palette is fixed, so build it (and everything derived from it) once
+# at import time rather than per DisplayManager instance
+_BG_COLOR = "#1a1a2e"
+_FG_COLOR = "#eaeaea"
+_ACCENT_COLOR = "#16213e"
+_HIGHLIGHT_COLOR = "#0f3460"
+_ALARM_COLOR = "#e94560"
+
+# Everything a row's appearance needs, indexed by the integer bucket
+# from _event_status_key: (status_text, emoji, status_color, bg, fg,
+# border). A tuple index replaces the comparison cascade previously run
+# per event per refresh, and the integer buckets make the status
+# snapshots cheap int tuples to build and compare.
+COMPLETED, IN_PROGRESS, EXPIRED, SOON, UPCOMING = range(5)
+_STATUS_TABLE = (
+    ("COMPLETED", "✓", "#4ecca3",
+     _BG_COLOR, "#666666", "#444444"),
+    ("IN PROGRESS", "▶", "#f39c12",
+     "#f39c12", _FG_COLOR, "#f39c12"),
+    ("EXPIRED", "✗", "#666666",
+     _BG_COLOR, "#666666", "#444444"),
+    ("STARTING SOON", "🔔", _ALARM_COLOR,
+     _HIGHLIGHT_COLOR, _FG_COLOR, _ALARM_COLOR),
+    ("UPCOMING", "📅", "#3498db",
+     _ACCENT_COLOR, _FG_COLOR, _ACCENT_COLOR),
+)
+
+# Feed catalog offered on the config tab. Built once at import time (the
+# form code only iterates it); the proxy keeps checkbox handlers from
+# mutating the shared catalog by accident.
+_ALL_FEEDS = MappingProxyType({
+    "BBC News": "http://feeds.bbci.co.uk/news/rss.xml",
+    "CNN": "http://rss.cnn.com/rss/edition.rss",
+    "Reuters": "https://www.reutersagency.com/feed/?taxonomy=best-topics&post_type=best",
+    "TechCrunch": "https://techcrunch.com/feed/",
+    "The Guardian": "https://www.theguardian.com/world/rss",
+    "China Daily": "http://www.chinadaily.com.cn/rss/world_rss.xml",
+    "Xinhua English": "http://www.news.cn/english/rss/englishrssnew.xml",
+    "CGTN": "https://www.cgtn.com/rss/news.xml",
+    "South China Morning Post": "https://www.scmp.com/rss/91/feed",
+    "中新网即时新闻": "https://www.chinanews.com.cn/rss/scroll-news.xml"
+})
+
+
+class DisplayManager:
+    """Manages the GUI display for events"""
+    
+    def __init__(self, config: dict, secrets: dict = None):
+        self.full_config = config  # Store full config
+        self.secrets = secrets or {}  # Store secrets
+        self.config = config['display']
+        self.logger = logging.getLogger(__name__)
+        
+        # Create main window
+        self.root = tk.Tk()
+        self.root.title(self.config['window_title'])
+        self.root.geometry(f"{self.config['width']}x{self.config['height']}")
+        
+        if self.config.get('fullscreen', False):
+            self.root.attributes('-fullscreen', True)
+            self.root.bind('<Escape>', lambda e: self.root.attributes('-fullscreen', False))
+
+        # Keep the window unmapped until the widget tree exists (see
+        # _ensure_ui) - nothing paints during construction and the first
+        # frame the user sees is the finished layout
+        self.root.withdraw()
+        
+        # Configure colors (shared module-level palette)
+        self.bg_color = _BG_COLOR
+        self.fg_color = _FG_COLOR
+        self.accent_color = _ACCENT_COLOR
+        self.highlight_color = _HIGHLIGHT_COLOR
+        self.alarm_color = _ALARM_COLOR
+
+        self.root.configure(bg=self.bg_color)
+
+        self._status_table = _STATUS_TABLE
+
+        # Shared fonts - each tkfont.Font() allocates a named font
+        # resource in Tcl, so roles map onto fonts deduplicated by
+        # (size, weight): several roles share a spec, and Tcl only needs
+        # one named font per distinct spec. The cache lives per instance
+        # rather than on the class because named fonts belong to a Tcl
+        # interpreter, i.e. to this root window.
+        self._font_cache = {}
+        self._fonts = {
+            'time': self._font(16, 'bold'),
+            'title': self._font(14, 'bold'),
+            'status': self._font(9, 'bold'),
+            'desc': self._font(11),
+            'news_number': self._font(18, 'bold'),
+            'news_title': self._font(14, 'bold'),
+            'news_desc': self._font(11),
+            'no_events': self._font(16),
+            'no_news': self._font(12),
+            'tab': self._font(11, 'bold'),
+            'header_title': self._font(24, 'bold'),
+            'clock': self._font(18),
+            'date': self._font(11),
+            'status_bar': self._font(12),
+            'button': self._font(12, 'bold'),
+            'small_button': self._font(11, 'bold'),
+            'small': self._font(11),
+            'speaking_title': self._font(10, 'bold'),
+            'speaking_text': self._font(12),
+            'form': self._font(10),
+            'label': self._font(10, 'bold'),
+            'section': self._font(12, 'bold'),
+            'tiny': self._font(9),
+        }
+
+        # Frequently updated labels get a textvariable - StringVar.set is
+        # a single Tcl variable write instead of a full widget configure
+        # (option-table walk plus geometry re-evaluation)
+        self._time_var = tk.StringVar(master=self.root)
+        self._date_var = tk.StringVar(master=self.root)
+        self._status_var = tk.StringVar(master=self.root, value="🟢 System Ready")
+        self._last_status_text = "🟢 System Ready"  # last applied status text
+        self._status_fg = "#4ecca3"  # last applied status color
+        self._page_var = tk.StringVar(master=self.root, value="Page 0/0")
+        self._news_counter_var = tk.StringVar(master=self.root, value="No news loaded")
+        self._speaking_var = tk.StringVar(master=self.root)
+        self._config_status_var = tk.StringVar(master=self.root)
+        self._config_status_fg = "#4ecca3"  # last applied feedback color
+
+        # State - initialize before UI setup
+        self.events = []  # kept sorted by event_time (update_events)
+        self._event_ts = []  # parallel float timestamps (update_events)
+        self.is_alarm_active = False
+
+        # Pooled event rows: rows are built once and reconfigured in place
+        # on refresh, instead of destroying and recreating the whole
+        # subtree (and its geometry) every 30 s
+        self._event_rows = []
+        # News page widgets are pooled the same way (at most
+        # items_per_page of them ever exist)
+        self._news_rows = []
+        self._no_news_label = None
+        self._desc_labels = []  # pooled description labels (shared wrap)
+        self._row_wraplength = 0  # current wrap width for all rows
+        self._no_events_label = None
+        self._last_status_snapshot = None
+        self._refresh_scheduled = False
+        self._refresh_after_id = None
+        self._render_generation = 0
+
+        # Clock caches (date line recomputed at midnight, time string
+        # rewritten only when the displayed second actually differs)
+        self._cached_date_str = ""
+        self._cached_date_ordinal = None
+        self._last_time_str = ""
+        
+        # News state
+        self.news_items = []
+        self.current_page = 0
+        self.items_per_page = 5
+        self._total_pages = 0  # recomputed only when news_items changes
+        self.current_item_in_page = 0
+        self.auto_read_active = False
+        self.auto_read_on_tab_switch = True
+        self._pending_auto_advance = False
+        self._pending_speaking_text = None
+        self._pending_hide_speaking = False
+        self._pending_news_result = None  # 1-tuple holding a fetch result
+        self._speaking_visible = False
+        self._stop_button_visible = False
+        
+        # Callbacks registered by the controller. These must live here,
+        # not in _setup_ui: with the lazy build the controller registers
+        # them before the widget tree exists, and a later re-init would
+        # silently wipe them
+        self.on_stop_alarm_callback = None
+        self.on_fetch_news_callback = None
+        self.on_read_news_callback = None
+        self.on_news_fetched_callback = None
+
+        # Config state
+        self.config_entries = {}  # Store entry widgets for config
+        self.on_save_config_callback = None
+
+        # The widget tree is built lazily on first run()/update() (or the
+        # first call that needs a widget), so the controller's remaining
+        # subsystem init - pygame mixer, voice recognition, chatbot -
+        # doesn't run with a few hundred Tk widgets already resident.
+        # The root window and the variables above stay eager because
+        # other modules schedule onto display.root and poke state early.
+        self._ui_built = False
+        # True only while run() sits in mainloop(). _tkinter gates
+        # cross-thread calls on the interpreter's dispatching flag, which
+        # the update()-driven loop never sets - worker threads must not
+        # attempt after_idle outside mainloop (see _dispatch_to_ui)
+        self._in_mainloop = False
+
+        self._news_cancel_token = 0  # Incremented to cancel all pending news actions
+
+    def _ensure_ui(self):
+        """Build the widget tree on first use"""
+        if self._ui_built:
+            return
+        self._ui_built = True
+        self._setup_ui()
+        # Run the deferred geometry work in one pass over the finished
+        # tree, then map the window: X paints the final layout once
+        # instead of every intermediate state of the build
+        self.root.update_idletasks()
+        self.root.deiconify()
+        # Sweep for pending updates pushed by worker threads
+        self.root.after(100, self._check_pending_updates)
+        # Flush anything buffered before the build
+        if self.events:
+            self._request_refresh()
+        
+    def _font(self, size: int, weight: str = 'normal') -> tkfont.Font:
+        """Shared named font for a (size, weight) spec, created on demand"""
+        key = (size, weight)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = tkfont.Font(
+                family="Helvetica", size=size, weight=weight)
+        return font
+
+    def _setup_ui(self):
+        """Setup the UI components"""
+        # Header Frame
+        header_frame = tk.Frame(self.root, bg=self.accent_color, height=80)
+        header_frame.pack(fill=tk.X, pady=(0, 10))
+        header_frame.pack_propagate(False)
+        
+        # Title
+        self.title_label = tk.Label(
+            header_frame,
+            text="🤖 AI Reminder System",
+            font=self._fonts['header_title'],
+            bg=self.accent_color,
+            fg=self.fg_color
+        )
+        self.title_label.pack(side=tk.LEFT, padx=20, pady=15)
+        
+        # Clock - time and date are separate labels so the once-a-day
+        # date update doesn't force a re-measure of the 1 Hz time label
+        clock_frame = tk.Frame(header_frame, bg=self.accent_color)
+        clock_frame.pack(side=tk.RIGHT, padx=20, pady=10)
+
+        self.time_label = tk.Label(
+            clock_frame,
+            textvariable=self._time_var,
+            font=self._fonts['clock'],
+            bg=self.accent_color,
+            fg=self.fg_color
+        )
+        self.time_label.pack(anchor=tk.E)
+
+        self.date_label = tk.Label(
+            clock_frame,
+            textvariable=self._date_var,
+            font=self._fonts['date'],
+            bg=self.accent_color,
+            fg=self.fg_color
+        )
+        self.date_label.pack(anchor=tk.E)
+        
+        # Status Frame
+        status_frame = tk.Frame(self.root, bg=self.bg_color)
+        status_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        self.status_label = tk.Label(
+            status_frame,
+            textvariable=self._status_var,
+            font=self._fonts['status_bar'],
+            bg=self.bg_color,
+            fg=self._status_fg
+        )
+        self.status_label.pack(side=tk.LEFT)
+        
+        # Stop Alarm Button (initially hidden)
+        self.stop_button = tk.Button(
+            status_frame,
+            text="🛑 STOP ALARM",
+            font=self._fonts['button'],
+            bg=self.alarm_color,
+            fg=self.fg_color,
+            activebackground="#c0392b",
+            activeforeground=self.fg_color,
+            relief=tk.RAISED,
+            bd=3,
+            padx=20,
+            pady=5,
+            cursor="hand2",
+            command=self._on_stop_button_click
+        )
+        # Button is hidden by default
+
+        # Speaking Text Frame (for displaying current voice output)
+        self.speaking_frame = tk.Frame(self.root, bg=self.highlight_color, relief=tk.RAISED, bd=2)
+        self.speaking_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        self.speaking_frame.pack_forget()  # Hidden by default
+        
+        speaking_title = tk.Label(
+            self.speaking_frame,
+            text="🔊 Speaking:",
+            font=self._fonts['speaking_title'],
+            bg=self.highlight_color,
+            fg="#4ecca3"
+        )
+        speaking_title.pack(anchor=tk.W, padx=10, pady=(5, 0))
+        
+        self.speaking_label = tk.Label(
+            self.speaking_frame,
+            textvariable=self._speaking_var,
+            font=self._fonts['speaking_text'],
+            bg=self.highlight_color,
+            fg=self.fg_color,
+            anchor=tk.W,
+            justify=tk.LEFT,
+            wraplength=self.config['width'] - 60
+        )
+        self.speaking_label.pack(fill=tk.X, padx=10, pady=(0, 10))
+        # Track the real frame width (fullscreen toggle, resizes) instead
+        # of trusting the configured window width forever
+        self._bind_wraplength(self.speaking_frame, [self.speaking_label], 40)
+        
+        # Main Content Area with Tabs
+        content_frame = tk.Frame(self.root, bg=self.bg_color)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        
+        # Create notebook (tabbed interface)
+        style = ttk.Style()
+        style.theme_use('default')
+        style.configure('TNotebook', background=self.bg_color, borderwidth=0)
+        # Pass the named Font object, not a ('Helvetica', 11, 'bold')
+        # tuple - Tcl resolves a named font by hash on each draw instead
+        # of re-parsing the tuple into an anonymous font
+        style.configure('TNotebook.Tab',
+                       background=self.accent_color,
+                       foreground=self.fg_color,
+                       padding=[20, 10],
+                       font=self._fonts['tab'])
+        style.map('TNotebook.Tab',
+                 background=[('selected', self.highlight_color)],
+                 foreground=[('selected', '#4ecca3')])
+        
+        self.notebook = ttk.Notebook(content_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Events Tab
+        events_tab = tk.Frame(self.notebook, bg=self.bg_color)
+        self.notebook.add(events_tab, text="📅 Events")
+        
+        # Scrollable canvas for events
+        self._events_canvas, self.scrollable_frame = self._make_scrollable(events_tab)
+        
+        # News Tab - the frame is added now so the tab exists, but its
+        # widgets are only built on first visit (_ensure_news_tab)
+        self._news_tab = tk.Frame(self.notebook, bg=self.bg_color)
+        self.notebook.add(self._news_tab, text="📰 News")
+        self._news_tab_built = False
+
+        # Config Tab - same lazy pattern as News: the tab exists at
+        # startup but its form (a few dozen widgets) builds on first visit
+        self._config_tab = tk.Frame(self.notebook, bg=self.bg_color)
+        self.notebook.add(self._config_tab, text="⚙️ Config")
+        self._config_tab_built = False
+
+        # Bind tab change event (also triggers the lazy tab build)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Switch to News tab by default (tab index 1)
+        self.notebook.select(1)
+        
+        # Update clock
+        self._update_clock()
+        
+        # Auto-refresh event statuses
+        self._auto_refresh_events()
+    
+    def _ensure_news_tab(self):
+        """Build the news tab contents if they don't exist yet"""
+        self._ensure_ui()
+        if not self._news_tab_built:
+            self._news_tab_built = True
+            self._setup_news_tab()
+
+    def _setup_news_tab(self):
+        """Setup the news tab contents (deferred until first needed)"""
+        news_tab = self._news_tab
+
+        # Control Frame
+        control_frame = tk.Frame(news_tab, bg=self.accent_color, height=60)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        control_frame.pack_propagate(False)
+        
+        # Fetch News Button
+        self.fetch_news_button = tk.Button(
+            control_frame,
+            text="🔄 Fetch News",
+            font=self._fonts['small_button'],
+            bg="#4ecca3",
+            fg=self.bg_color,
+            activebackground="#3dbb90",
+            relief=tk.RAISED,
+            bd=2,
+            padx=15,
+            pady=5,
+            cursor="hand2",
+            command=self._on_fetch_news_click
+        )
+        self.fetch_news_button.pack(side=tk.LEFT, padx=20, pady=10)
+        
+        # News counter label
+        self.news_counter_label = tk.Label(
+            control_frame,
+            textvariable=self._news_counter_var,
+            font=self._fonts['small'],
+            bg=self.accent_color,
+            fg=self.fg_color
+        )
+        self.news_counter_label.pack(side=tk.LEFT, padx=10)
+        
+        # Page navigation label (right side)
+        self.page_label = tk.Label(
+            control_frame,
+            textvariable=self._page_var,
+            font=self._fonts['small_button'],
+            bg=self.accent_color,
+            fg=self.fg_color
+        )
+        self.page_label.pack(side=tk.RIGHT, padx=20)
+        
+        # News display area - scrollable frame for list of news
+        news_canvas, self.news_scrollable_frame = self._make_scrollable(news_tab)
+    
+    def _ensure_config_tab(self):
+        """Build the config tab contents if they don't exist yet"""
+        if not self._config_tab_built:
+            self._config_tab_built = True
+            self._setup_config_tab()
+
+    def _setup_config_tab(self):
+        """Setup the configuration tab contents (deferred until first needed)"""
+        config_tab = self._config_tab
+        
+        # Control Frame
+        control_frame = tk.Frame(config_tab, bg=self.accent_color, height=60)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        control_frame.pack_propagate(False)
+        
+        # Save Config Button
+        self.save_config_button = tk.Button(
+            control_frame,
+            text="💾 Save Configuration",
+            font=self._fonts['small_button'],
+            bg="#4ecca3",
+            fg=self.bg_color,
+            activebackground="#3dbb90",
+            relief=tk.RAISED,
+            bd=2,
+            padx=15,
+            pady=5,
+            cursor="hand2",
+            command=self._on_save_config_click
+        )
+        self.save_config_button.pack(side=tk.LEFT, padx=20, pady=10)
+        
+        # Status label for save feedback
+        self.config_status_label = tk.Label(
+            control_frame,
+            textvariable=self._config_status_var,
+            font=self._fonts['small'],
+            bg=self.accent_color,
+            fg=self._config_status_fg
+        )
+        self.config_status_label.pack(side=tk.LEFT, padx=10)
+        
+        # Scrollable config area
+        config_canvas, self.config_scrollable_frame = self._make_scrollable(
+            config_tab, padx=10, pady=10)
+        
+        # Build config form
+        self._build_config_form()
+        
+    def _build_config_form(self):
+        """Build the configuration form"""
+        form_font = self._fonts['form']
+        label_font = self._fonts['label']
+        section_font = self._fonts['section']
+        
+        # API Keys Section
+        self._add_section_header("🔑 API Keys", section_font)
+        self._add_config_field("OpenAI API Key", "openai_api_key", 
+                              self.secrets.get('openai_api_key', ''),
+                              label_font, form_font, is_secret=True)
+        self._add_config_field("Gemini API Key", "gemini_api_key",
+                              self.secrets.get('gemini_api_key', ''),
+                              label_font, form_font, is_secret=True)
+        
+        self._add_spacer()
+        
+        # TTS Configuration Section
+        self._add_section_header("🔊 Text-to-Speech", section_font)
+        tts_config = self.full_config.get('tts', {})
+        self._add_config_field("Speech Rate (100-200)", "tts.rate",
+                              str(tts_config.get('rate', 140)),
+                              label_font, form_font)
+        self._add_config_field("Volume (0.0-1.0)", "tts.volume",
+                              str(tts_config.get('volume', 0.9)),
+                              label_font, form_font)
+        self._add_config_field("English Voice Name", "tts.voice_name",
+                              tts_config.get('voice_name', 'Microsoft Zira Desktop'),
+                              label_font, form_font)
+        self._add_config_field("Chinese Voice Name", "tts.chinese_voice_name",
+                              tts_config.get('chinese_voice_name', 'Microsoft Huihui Desktop'),
+                              label_font, form_font)
+        
+        self._add_spacer()
+        
+        # Alarm Configuration Section
+        self._add_section_header("⏰ Alarm Settings", section_font)
+        alarm_config = self.full_config.get('alarm', {})
+        self._add_config_field("Voice Reminder Interval (seconds)", "alarm.voice_reminder_interval",
+                              str(alarm_config.get('voice_reminder_interval', 10)),
+                              label_font, form_font)
+        self._add_config_field("Auto Stop After (seconds)", "alarm.auto_stop_after",
+                              str(alarm_config.get('auto_stop_after', 1800)),
+                              label_font, form_font)
+        
+        self._add_spacer()
+        
+        # Chatbot Configuration Section
+        self._add_section_header("🤖 Chatbot", section_font)
+        chatbot_config = self.full_config.get('chatbot', {})
+        self._add_config_field("Provider (openai/gemini)", "chatbot.provider",
+                              chatbot_config.get('provider', 'openai'),
+                              label_font, form_font)
+        
+        openai_config = chatbot_config.get('openai', {})
+        self._add_config_field("OpenAI Model", "chatbot.openai.model",
+                              openai_config.get('model', 'gpt-3.5-turbo'),
+                              label_font, form_font)
+        
+        gemini_config = chatbot_config.get('gemini', {})
+        self._add_config_field("Gemini Model", "chatbot.gemini.model",
+                              gemini_config.get('model', 'gemini-pro'),
+                              label_font, form_font)
+        
+        self._add_spacer()
+        
+        # News Configuration Section
+        self._add_section_header("📰 News Feeds", section_font)
+        news_config = self.full_config.get('news', {})
+        self._add_config_field("Max Items Per Feed", "news.max_items_per_feed",
+                              str(news_config.get('max_items_per_feed', 5)),
+                              label_font, form_font)
+        
+        # All available news feeds (predefined list)
+        all_feeds = _ALL_FEEDS
+        
+        # Current active feeds from config
+        active_feeds = news_config.get('feeds', {})
+        
+        # Add checkboxes for each feed
+        self._add_news_feed_checkboxes(all_feeds, active_feeds, label_font)
+        
+        # Add custom feed input
+        self._add_custom_feed_input(active_feeds, all_feeds, label_font, form_font)
+        
+    def _add_news_feed_checkboxes(self, all_feeds, active_feeds, label_font):
+        """Add checkboxes for news feeds"""
+        self.feed_checkboxes = {}
+        
+        feeds_label = tk.Label(
+            self.config_scrollable_frame,
+            text="Select News Sources:",
+            font=label_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            anchor=tk.W
+        )
+        feeds_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+        
+        # Create frame for checkboxes
+        checkbox_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
+        checkbox_frame.pack(fill=tk.X, padx=20, pady=5)
+        
+        for feed_name, feed_url in all_feeds.items():
+            var = tk.BooleanVar(value=feed_name in active_feeds)
+            
+            cb = tk.Checkbutton(
+                checkbox_frame,
+                text=feed_name,
+                variable=var,
+                bg=self.bg_color,
+                fg=self.fg_color,
+                selectcolor=self.accent_color,
+                activebackground=self.bg_color,
+                activeforeground=self.fg_color,
+                font=self._fonts['form'],
+                anchor=tk.W
+            )
+            cb.pack(anchor=tk.W, pady=2)
+            
+            self.feed_checkboxes[feed_name] = {
+                'var': var,
+                'url': feed_url
+            }
+    
+    def _add_custom_feed_input(self, active_feeds, all_feeds, label_font, form_font):
+        """Add input fields for custom news feeds"""
+        custom_label = tk.Label(
+            self.config_scrollable_frame,
+            text="Add Custom Feed:",
+            font=label_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            anchor=tk.W
+        )
+        custom_label.pack(fill=tk.X, padx=10, pady=(15, 5))
+        
+        # Custom feed container
+        custom_frame = tk.Frame(self.config_scrollable_frame, bg=self.accent_color, relief=tk.RAISED, bd=2)
+        custom_frame.pack(fill=tk.X, padx=20, pady=5)
+        
+        # Feed name input
+        name_row = tk.Frame(custom_frame, bg=self.accent_color)
+        name_row.pack(fill=tk.X, padx=10, pady=(10, 5))
+        
+        name_label = tk.Label(
+            name_row,
+            text="Feed Name:",
+            font=form_font,
+            bg=self.accent_color,
+            fg=self.fg_color,
+            width=15,
+            anchor=tk.W
+        )
+        name_label.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.custom_feed_name = tk.Entry(
+            name_row,
+            font=form_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            insertbackground=self.fg_color,
+            relief=tk.FLAT
+        )
+        self.custom_feed_name.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=3)
+        
+        # Feed URL input
+        url_row = tk.Frame(custom_frame, bg=self.accent_color)
+        url_row.pack(fill=tk.X, padx=10, pady=(5, 5))
+        
+        url_label = tk.Label(
+            url_row,
+            text="Feed URL:",
+            font=form_font,
+            bg=self.accent_color,
+            fg=self.fg_color,
+            width=15,
+            anchor=tk.W
+        )
+        url_label.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.custom_feed_url = tk.Entry(
+            url_row,
+            font=form_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            insertbackground=self.fg_color,
+            relief=tk.FLAT
+        )
+        self.custom_feed_url.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=3)
+        
+        # Add button
+        add_button = tk.Button(
+            custom_frame,
+            text="➕ Add Feed",
+            font=self._fonts['label'],
+            bg="#4ecca3",
+            fg=self.bg_color,
+            activebackground="#3dbb90",
+            relief=tk.RAISED,
+            bd=2,
+            padx=10,
+            pady=3,
+            cursor="hand2",
+            command=self._on_add_custom_feed
+        )
+        add_button.pack(pady=(5, 10))
+        
+        # List of custom feeds
+        self.custom_feeds_listbox_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
+        self.custom_feeds_listbox_frame.pack(fill=tk.X, padx=20, pady=(5, 10))
+        
+        # Store custom feeds added during session
+        self.custom_feeds_list = []
+        self._load_custom_feeds(active_feeds, all_feeds)
+    
+    def _load_custom_feeds(self, active_feeds, predefined_feeds):
+        """Load custom feeds that are not in the predefined list"""
+        for feed_name, feed_url in active_feeds.items():
+            if feed_name not in predefined_feeds:
+                self._add_custom_feed_to_list(feed_name, feed_url)
+    
+    def _on_add_custom_feed(self):
+        """Handle adding a custom feed"""
+        name = self.custom_feed_name.get().strip()
+        url = self.custom_feed_url.get().strip()
+        
+        if name and url:
+            self._add_custom_feed_to_list(name, url)
+            
+            # Clear inputs
+            self.custom_feed_name.delete(0, tk.END)
+            self.custom_feed_url.delete(0, tk.END)
+        else:
+            # Show error message briefly
+            self._set_config_status("⚠️ Please enter both name and URL", "#e94560")
+            self.root.after(3000, lambda: self._config_status_var.set(""))
+    
+    def _add_custom_feed_to_list(self, name, url):
+        """Add a custom feed to the display list"""
+        feed_frame = tk.Frame(self.custom_feeds_listbox_frame, bg=self.accent_color, relief=tk.RAISED, bd=1)
+        feed_frame.pack(fill=tk.X, pady=2)
+        
+        var = tk.BooleanVar(value=True)
+        
+        cb = tk.Checkbutton(
+            feed_frame,
+            text=f"{name}",
+            variable=var,
+            bg=self.accent_color,
+            fg=self.fg_color,
+            selectcolor=self.bg_color,
+            activebackground=self.accent_color,
+            activeforeground=self.fg_color,
+            font=self._fonts['tiny'],
+            anchor=tk.W
+        )
+        cb.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
+        
+        # Delete button
+        del_btn = tk.Button(
+            feed_frame,
+            text="🗑️",
+            bg=self.alarm_color,
+            fg=self.fg_color,
+            relief=tk.FLAT,
+            bd=0,
+            padx=5,
+            cursor="hand2",
+            command=lambda: self._remove_custom_feed(feed_frame, name)
+        )
+        del_btn.pack(side=tk.RIGHT, padx=5, pady=2)
+        
+        self.custom_feeds_list.append({
+            'name': name,
+            'url': url,
+            'var': var,
+            'frame': feed_frame
+        })
+    
+    def _remove_custom_feed(self, frame, name):
+        """Remove a custom feed from the list"""
+        frame.destroy()
+        self.custom_feeds_list = [f for f in self.custom_feeds_list if f['name'] != name]
+        
+    def _add_section_header(self, text, font):
+        """Add a section header"""
+        header = tk.Label(
+            self.config_scrollable_frame,
+            text=text,
+            font=font,
+            bg=self.bg_color,
+            fg="#4ecca3",
+            anchor=tk.W
+        )
+        header.pack(fill=tk.X, padx=10, pady=(15, 5))
+        
+        separator = tk.Frame(self.config_scrollable_frame, bg=self.highlight_color, height=2)
+        separator.pack(fill=tk.X, padx=10, pady=(0, 10))
+    
+    def _add_config_field(self, label_text, config_key, value, label_font, entry_font, is_secret=False):
+        """Add a configuration field"""
+        row_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
+        row_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        label = tk.Label(
+            row_frame,
+            text=label_text + ":",
+            font=label_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            width=30,
+            anchor=tk.W
+        )
+        label.pack(side=tk.LEFT, padx=(0, 10))
+        
+        entry = tk.Entry(
+            row_frame,
+            font=entry_font,
+            bg=self.accent_color,
+            fg=self.fg_color,
+            insertbackground=self.fg_color,
+            relief=tk.FLAT,
+            show="*" if is_secret else None
+        )
+        entry.insert(0, value)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5, padx=(0, 10))
+        
+        self.config_entries[config_key] = entry
+    
+    def _add_info_text(self, label_text, info_text, label_font, text_font):
+        """Add an informational text area"""
+        row_frame = tk.Frame(self.config_scrollable_frame, bg=self.bg_color)
+        row_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        label = tk.Label(
+            row_frame,
+            text=label_text + ":",
+            font=label_font,
+            bg=self.bg_color,
+            fg=self.fg_color,
+            anchor=tk.NW
+        )
+        label.pack(anchor=tk.W, padx=(0, 10), pady=(0, 5))
+        
+        text_widget = tk.Text(
+            row_frame,
+            font=text_font,
+            bg=self.accent_color,
+            fg=self.fg_color,
+            height=6,
+            wrap=tk.WORD,
+            relief=tk.FLAT,
+            state=tk.DISABLED
+        )
+        text_widget.pack(fill=tk.X, expand=True)
+        
+        # Enable, insert text, then disable again
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(1.0, info_text)
+        text_widget.config(state=tk.DISABLED)
+    
+    def _add_spacer(self):
+        """Add a spacer between sections"""
+        spacer = tk.Frame(self.config_scrollable_frame, bg=self.bg_color, height=10)
+        spacer.pack(fill=tk.X)
+    
+    def _on_save_config_click(self):
+        """Handle save config button click"""
+        if self.on_save_config_callback:
+            # Collect values from entries
+            config_values = {}
+            for key, entry in self.config_entries.items():
+                config_values[key] = entry.get()
+            
+            # Collect selected news feeds
+            news_feeds = {}
+            
+            # Add predefined feeds that are checked
+            for feed_name, feed_data in self.feed_checkboxes.items():
+                if feed_data['var'].get():
+                    news_feeds[feed_name] = feed_data['url']
+            
+            # Add custom feeds that are checked
+            for custom_feed in self.custom_feeds_list:
+                if custom_feed['var'].get():
+                    news_feeds[custom_feed['name']] = custom_feed['url']
+            
+            config_values['news.feeds'] = news_feeds
+            
+            self.on_save_config_callback(config_values)
+            self._set_config_status("✅ Configuration saved!", "#4ecca3")
+            # Clear status after 3 seconds
+            self.root.after(3000, lambda: self._config_status_var.set(""))
+        
+    def _set_config_status(self, message: str, color: str):
+        """Update the save-feedback text, writing fg only when it changes"""
+        self._config_status_var.set(message)
+        if color != self._config_status_fg:
+            self._config_status_fg = color
+            self.config_status_label.config(fg=color)
+
+    def set_config_callback(self, callback):
+        """Set callback for config save"""
+        self.on_save_config_callback = callback
+        
+    @staticmethod
+    def _event_status_key(triggered: bool, diff: float) -> int:
+        """Classify an event into its _STATUS_TABLE index.
+
+        `diff` is seconds until the event starts (negative once started),
+        computed from the float timestamps cached in update_events - a
+        plain subtraction instead of a datetime __sub__ that allocates a
+        timedelta per event per tick.
+        """
+        if triggered:
+            return COMPLETED
+        if -3600 <= diff <= 0:
+            return IN_PROGRESS
+        if diff < -3600:
+            return EXPIRED
+        if diff <= 300:
+            return SOON
+        return UPCOMING
+
+    def _status_snapshot(self, now_ts: float) -> tuple:
+        """Status buckets of all events, for change detection"""
+        return tuple(self._event_status_key(event.triggered, ts - now_ts)
+                     for event, ts in zip(self.events, self._event_ts))
+
+    def _auto_refresh_events(self):
+        """Auto-refresh events display to update statuses"""
+        delay_ms = 30000
+        # With another tab in front the events canvas isn't mapped, so a
+        # snapshot/redraw would be pure wasted work; tick at the 30 s
+        # backstop and let _on_tab_changed catch up when it comes back
+        if self.events and self.notebook.index('current') == 0:
+            # Only redraw when some event actually crossed a status
+            # boundary - the common tick reduces to this O(N) comparison
+            # with zero Tk calls
+            now_ts = time.time()
+            snapshot = self._status_snapshot(now_ts)
+            if snapshot != self._last_status_snapshot:
+                self._last_status_snapshot = snapshot
+                self._request_refresh()
+            delay_ms = self._next_refresh_delay_ms(now_ts)
+        self._refresh_after_id = self.root.after(delay_ms,
+                                                 self._auto_refresh_events)
+
+    def _next_refresh_delay_ms(self, now_ts: float) -> int:
+        """Milliseconds until the next status-boundary crossing.
+
+        Statuses only flip when an event's time distance passes 300 s, 0 s
+        or -3600 s, so instead of polling on a fixed cadence we sleep
+        right up to the soonest such crossing (clamped to 1-30 s; the cap
+        keeps the timer honest if the event list changes underneath us).
+        """
+        soonest = None
+        for event, ts in zip(self.events, self._event_ts):
+            if event.triggered:
+                continue
+            diff = ts - now_ts
+            for until_crossing in (diff - 300, diff, diff + 3600):
+                if until_crossing > 0 and (soonest is None or until_crossing < soonest):
+                    soonest = until_crossing
+        if soonest is None:
+            return 30000
+        # Land just past the boundary so the snapshot actually differs
+        return max(1000, min(30000, int(soonest * 1000) + 50))
+        
+    def _update_clock(self):
+        """Update the clock display"""
+        # time.localtime() hands back a lightweight struct; formatting the
+        # time with f-string int fields skips the whole strftime format
+        # machinery on the 1 Hz path
+        lt = time.localtime()
+        # The date label changes once a day - reformat and rewrite it only
+        # when the day rolls over instead of on all 86,400 ticks
+        day = (lt.tm_year, lt.tm_yday)
+        if day != self._cached_date_ordinal:
+            self._cached_date_ordinal = day
+            self._cached_date_str = time.strftime("%A, %B %d, %Y", lt)
+            self._date_var.set(self._cached_date_str)
+        # after(1000) can fire twice inside the same displayed second
+        # under timer jitter; skip the variable write when nothing changed
+        time_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self._time_var.set(time_str)
+        self.root.after(1000, self._update_clock)
+        
+    def update_events(self, events: List[Event]):
+        """Update the events display"""
+        # Sort once per list change - every refresh in between reuses the
+        # sorted order (attrgetter keeps the key extraction in C), and the
+        # snapshot/display orders can never drift apart
+        self.events = sorted(events, key=operator.attrgetter('event_time'))
+        # Cache float timestamps so every later tick is a subtraction
+        # against one time.time() instead of N datetime subtractions
+        now_ts = time.time()
+        self._event_ts = [event.event_time.timestamp() for event in self.events]
+        self._last_status_snapshot = self._status_snapshot(now_ts)
+        self._request_refresh()
+        # The pending auto-refresh tick was aimed at the old list's next
+        # boundary; re-aim it so a closer crossing in the new list isn't
+        # missed and a stale one doesn't fire early
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = self.root.after(
+                self._next_refresh_delay_ms(now_ts),
+                self._auto_refresh_events)
+        
+    def _request_refresh(self):
+        """Schedule one events redraw, coalescing bursts of requests.
+
+        Several alarms firing (or being cleared) in the same event-loop
+        pass collapse into a single rebuild.
+        """
+        if self._refresh_scheduled or not self._ui_built:
+            return
+        self._refresh_scheduled = True
+        self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_scheduled = False
+        self._refresh_events_display()
+
+    def _refresh_events_display(self):
+        """Refresh the events list on screen"""
+        if not self.events:
+            # Hide any pooled rows, then show the placeholder
+            for row in self._event_rows:
+                if row['visible']:
+                    row['frame'].pack_forget()
+                    row['visible'] = False
+            if self._no_events_label is None:
+                self._no_events_label = tk.Label(
+                    self.scrollable_frame,
+                    text="📭 No events scheduled for today",
+                    font=self._fonts['no_events'],
+                    bg=self.bg_color,
+                    fg=self.fg_color,
+                    pady=50
+                )
+            self._no_events_label.pack()
+            return
+
+        if self._no_events_label is not None:
+            self._no_events_label.pack_forget()
+
+        # Events were sorted when the list last changed (update_events)
+        sorted_events = self.events
+
+        # Classify everything in one pre-pass against a single timestamp:
+        # no per-row clock reads, and the whole redraw sees one consistent
+        # view of "now"
+        now_ts = time.time()
+        keys = [self._event_status_key(event.triggered, ts - now_ts)
+                for event, ts in zip(sorted_events, self._event_ts)]
+
+        # Render in chunks spread over idle callbacks: a long list never
+        # blocks the event loop for the whole rebuild, and a refresh
+        # requested mid-pass simply supersedes the stale generation.
+        # In steady state update order is free, so start at the row the
+        # scroll position points at and wrap around: whatever is actually
+        # on screen is correct after the first chunk, which is the
+        # windowing property that matters. Rotation is only safe when no
+        # row will be (re)packed this pass - pack() appends to the end of
+        # the pack order, so any hidden row in range (pool still growing,
+        # or the list shrank and grew back) must be mapped in index order
+        # or the display order scrambles permanently.
+        count = len(sorted_events)
+        order = range(count)
+        if (len(self._event_rows) >= count
+                and all(row['visible'] for row in self._event_rows[:count])):
+            first = int(self._events_canvas.yview()[0] * count)
+            if first:
+                order = list(order[first:]) + list(order[:first])
+        self._render_generation += 1
+        self._render_rows(sorted_events, keys, order, 0, self._render_generation)
+
+    def _render_rows(self, events, keys, order, pos, generation):
+        """Render one chunk of pooled rows, rescheduling the remainder"""
+        if generation != self._render_generation:
+            return
+        # Reuse pooled rows in display order; hidden rows are always a
+        # suffix of the pool, so pack order stays consistent
+        end = min(pos + _REFRESH_CHUNK, len(order))
+        chunk = order[pos:end]
+        # Grow the pool for the whole chunk up front so widget creation is
+        # one contiguous burst of Tcl commands instead of interleaving
+        # creates with configures row by row. The packs themselves are
+        # cheap to batch: Tk's geometry manager recomputes layout at idle,
+        # so however many rows map in this chunk, it is one layout pass.
+        while len(self._event_rows) < max(chunk, default=-1) + 1:
+            self._event_rows.append(self._create_event_row())
+        for i in chunk:
+            self._update_event_row(self._event_rows[i], events[i], keys[i])
+        if end < len(order):
+            self.root.after_idle(self._render_rows, events, keys, order, end,
+                                 generation)
+            return
+        for row in self._event_rows[len(events):]:
+            if row['visible']:
+                row['frame'].pack_forget()
+                row['visible'] = False
+
+    # Note on ttk.Treeview: a virtualized tree would render huge lists
+    # almost for free, but it draws one flat line per item - no per-row
+    # multi-line wrapped descriptions, no per-cell fonts, and per-tag
+    # colors only. The pooled rows below keep that layout while capping
+    # steady-state Tk work at "rows whose status changed", which is the
+    # property a Treeview would have bought. With chunked visible-first
+    # rendering and the hidden-tab pause on top, the remaining gap to a
+    # Treeview is initial-build cost only, paid once per pool growth.
+    def _create_event_row(self) -> dict:
+        """Build one reusable event row (widgets only, no event data)"""
+        event_frame = tk.Frame(self.scrollable_frame, padx=2, pady=2)
+
+        inner_frame = tk.Frame(event_frame, padx=15, pady=10)
+        inner_frame.pack(fill=tk.BOTH)
+
+        time_label = tk.Label(inner_frame, font=self._fonts['time'])
+        time_label.pack(side=tk.LEFT, padx=(0, 15))
+
+        details_frame = tk.Frame(inner_frame)
+        details_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        title_label = tk.Label(details_frame, font=self._fonts['title'], anchor="w")
+        title_label.pack(fill=tk.X)
+
+        status_label = tk.Label(details_frame, font=self._fonts['status'], anchor="w")
+        status_label.pack(fill=tk.X)
+
+        desc_label = tk.Label(details_frame, font=self._fonts['desc'],
+                              anchor="w",
+                              wraplength=self._row_wraplength or 500)
+        self._desc_labels.append(desc_label)
+        # All rows share one width, so one <Configure> binding on the
+        # first row's details frame drives the wrap width for the whole
+        # pool instead of N per-row handlers re-measuring the same number
+        if len(self._desc_labels) == 1:
+            self._bind_row_wraplength(details_frame)
+
+        return {
+            'frame': event_frame,
+            'inner': inner_frame,
+            'time': time_label,
+            'details': details_frame,
+            'title': title_label,
+            'status': status_label,
+            'desc': desc_label,
+            'visible': False,
+            'desc_visible': False,
+            'content_sig': None,
+            'key': None,
+        }
+
+    def _update_event_row(self, row: dict, event: Event, key: int):
+        """Reconfigure a pooled row in place for the given event.
+
+        `key` comes from the classification pre-pass in
+        _refresh_events_display, so every row in a redraw shares the same
+        "now" and the drawn status can never disagree with the snapshot.
+        """
+        # Content and status are memoized separately: on the common tick a
+        # row crossing a threshold only recolors (the expensive part of a
+        # text write is the description re-wrap, and the text didn't
+        # change), while a backend edit with an unchanged status bucket
+        # only rewrites text. Rows matching on both skip all Tcl traffic.
+        content_sig = (event.id, event.title, event.description,
+                       event.event_time)
+        content_changed = content_sig != row['content_sig']
+        key_changed = key != row['key']
+        if not content_changed and not key_changed:
+            if not row['visible']:
+                row['frame'].pack(fill=tk.X, pady=5)
+                row['visible'] = True
+            return
+        row['content_sig'] = content_sig
+        row['key'] = key
+        (status_text, status_emoji, status_color,
+         bg, fg, border_color) = self._status_table[key]
+
+        if key_changed:
+            row['frame'].config(bg=border_color)
+            row['inner'].config(bg=bg)
+            row['details'].config(bg=bg)
+            row['time'].config(bg=bg, fg=fg)
+            row['status'].config(text=f"● {status_text}", bg=bg,
+                                 fg=status_color)
+        if content_changed:
+            row['time'].config(text=event.time_hhmm)
+        # The title embeds the status emoji, so either kind of change
+        # rewrites it
+        row['title'].config(text=f"{status_emoji} {event.title}", bg=bg, fg=fg)
+
+        if event.description:
+            if content_changed:
+                row['desc'].config(text=event.description)
+            if key_changed:
+                row['desc'].config(bg=bg, fg=fg)
+            if not row['desc_visible']:
+                row['desc'].pack(fill=tk.X)
+                row['desc_visible'] = True
+        elif row['desc_visible']:
+            row['desc'].pack_forget()
+            row['desc_visible'] = False
+
+        if not row['visible']:
+            row['frame'].pack(fill=tk.X, pady=5)
+            row['visible'] = True
+    
+    def show_alarm(self, event: Event):
+        """Show alarm notification"""
+        self.is_alarm_active = True
+        self._set_status(f"🔔 ALARM: {event.title}", self.alarm_color)
+        # Re-packing an already-managed button re-runs the status frame's
+        # geometry manager, and overlapping alarms call this repeatedly -
+        # only touch the packer on the hidden->visible transition
+        if self._ui_built and not self._stop_button_visible:
+            self._stop_button_visible = True
+            self.stop_button.pack(side=tk.RIGHT, padx=20)
+        self._request_refresh()
+        
+    def clear_alarm(self):
+        """Clear alarm notification"""
+        self.is_alarm_active = False
+        self._set_status("🟢 System Ready", "#4ecca3")
+        if self._ui_built and self._stop_button_visible:
+            self._stop_button_visible = False
+            self.stop_button.pack_forget()
+        self._request_refresh()
+    
+    def _on_stop_button_click(self):
+        """Handle stop button click"""
+        self.logger.info("Stop button clicked on HMI")
+        if self.on_stop_alarm_callback:
+            self.on_stop_alarm_callback()
+    
+    def set_stop_alarm_callback(self, callback):
+        """Set callback for stop alarm button"""
+        self.on_stop_alarm_callback = callback
+        
+    def _set_status(self, message: str, color: str):
+        """Update status text and color, skipping redundant color writes.
+
+        The text is a StringVar write; the fg configure - a full widget
+        option update - only happens when the color actually changes,
+        which it rarely does between consecutive status messages.
+        """
+        # The controller re-asserts "System Active - Listening" on every
+        # utterance; an unchanged message needs no variable write (which
+        # would re-fire the label's trace and re-measure the text)
+        if message != self._last_status_text:
+            self._last_status_text = message
+            self._status_var.set(message)
+        if color != self._status_fg:
+            self._status_fg = color
+            if self._ui_built:
+                self.status_label.config(fg=color)
+
+    def update_status(self, message: str, color: str = "#4ecca3"):
+        """Update status message"""
+        self._set_status(message, color)
+    
+    def _make_scrollable(self, parent, **canvas_pack):
+        """Build the scrollable canvas + inner frame pair used by each tab"""
+        canvas = tk.Canvas(parent, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        frame = tk.Frame(canvas, bg=self.bg_color)
+        self._bind_scrollregion(frame, canvas)
+        canvas.create_window((0, 0), window=frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, **canvas_pack)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return canvas, frame
+
+    def _bind_scrollregion(self, frame, canvas):
+        """Keep the canvas scrollregion in sync with its inner frame.
+
+        Every row pack during a refresh fires <Configure>; the burst is
+        coalesced into one after_idle recompute, and that recompute asks
+        the frame for its requested size - which Tk's geometry manager
+        maintains incrementally - instead of bbox("all"), which walks
+        every canvas item on each call.
+        """
+        scheduled = [False]
+        last_size = [-1, -1]
+
+        def _apply():
+            scheduled[0] = False
+            width = frame.winfo_reqwidth()
+            height = frame.winfo_reqheight()
+            # <Configure> also fires for pure moves and same-size relayouts
+            # (pooled rows reconfiguring in place); only push a new
+            # scrollregion when the content dimensions actually changed
+            if width != last_size[0] or height != last_size[1]:
+                last_size[0] = width
+                last_size[1] = height
+                canvas.configure(scrollregion=(0, 0, width, height))
+
+        def _on_configure(event):
+            if not scheduled[0]:
+                scheduled[0] = True
+                self.root.after_idle(_apply)
+
+        frame.bind("<Configure>", _on_configure)
+
+    def _bind_row_wraplength(self, frame):
+        """Drive every pooled desc label's wraplength from one binding.
+
+        The wrap width changes only on real geometry changes (resize,
+        fullscreen toggle), so refreshes never touch wraplength at all;
+        rows created later pick up the cached width at construction.
+        """
+        def _on_configure(event):
+            width = event.width - 20
+            if width > 0 and width != self._row_wraplength:
+                self._row_wraplength = width
+                for label in self._desc_labels:
+                    label.config(wraplength=width)
+
+        frame.bind("<Configure>", _on_configure, add=True)
+
+    def _bind_wraplength(self, frame, labels, pad: int):
+        """Keep the labels' wraplength in sync with the frame's width.
+
+        Tk fires <Configure> only on actual geometry changes, so wrap
+        widths follow resizes (e.g. the Escape fullscreen toggle) without
+        any per-refresh recalculation.
+        """
+        last_width = 0
+
+        def _on_configure(event):
+            nonlocal last_width
+            width = event.width - pad
+            if width > 0 and width != last_width:
+                last_width = width
+                for label in labels:
+                    label.config(wraplength=width)
+
+        frame.bind("<Configure>", _on_configure, add=True)
+
+    def _dispatch_to_ui(self, func, *args) -> bool:
+        """Schedule a callable on the Tk event loop, if that is possible.
+
+        Returns False when the call cannot be delivered, in which case
+        callers fall back to the polled _pending_* state. Cross-thread
+        after_idle only works while the main thread sits in mainloop() -
+        outside it (the update()-driven production loop, or teardown)
+        _tkinter blocks the caller about a second in WaitForMainloop and
+        then raises, so detect that case up front instead of paying the
+        block inside TTS and recognizer threads.
+        """
+        if (not self._in_mainloop
+                and threading.current_thread() is not threading.main_thread()):
+            return False
+        try:
+            self.root.after_idle(func, *args)
+            return True
+        except (RuntimeError, tk.TclError):
+            return False
+
+    def show_speaking_text(self, text: str):
+        """Show text that is being spoken (thread-safe)"""
+        # Push straight onto the event loop instead of waiting up to
+        # 100 ms for the polling tick to notice a flag
+        if not self._dispatch_to_ui(self._apply_speaking_text, text):
+            self._pending_speaking_text = text
+
+    def _apply_speaking_text(self, text: str):
+        """Apply speaking text to the UI (runs on the Tk thread)"""
+        # TTS progress callbacks can re-report the same sentence; an
+        # unchanged string needs no var write (which would re-fire the
+        # label trace and re-measure the wrapped text)
+        if text != self._speaking_var.get():
+            self._speaking_var.set(text)
+        # Re-packing an already-managed frame still forces a geometry
+        # re-manage, and speech updates can arrive several times a second
+        # - only pack on the hidden->visible transition
+        if not self._speaking_visible:
+            self._speaking_visible = True
+            self.speaking_frame.pack(fill=tk.X, padx=20, pady=(0, 10), after=self.status_label.master)
+
+    def hide_speaking_text(self):
+        """Hide speaking text display (thread-safe)"""
+        if not self._dispatch_to_ui(self._apply_hide_speaking):
+            self._pending_hide_speaking = True
+
+    def _apply_hide_speaking(self):
+        """Hide the speaking frame (runs on the Tk thread)"""
+        if self._speaking_visible:
+            self._speaking_visible = False
+            self.speaking_frame.pack_forget()
+    
+    # News Tab Methods
+    def set_news_callbacks(self, fetch_callback, read_callback,
+                           fetched_callback=None):
+        """Set callbacks for news functions.
+
+        fetch_callback must do the network work only and return the
+        fetched items (None on error) - the button path runs it on a
+        worker thread, so it must not touch any widget. fetched_callback
+        receives the items back on the Tk thread.
+        """
+        self.on_fetch_news_callback = fetch_callback
+        self.on_read_news_callback = read_callback
+        self.on_news_fetched_callback = fetched_callback
+
+    def _on_fetch_news_click(self):
+        """Handle fetch news button click"""
+        self.logger.info("Fetch news button clicked")
+        if not self.on_fetch_news_callback:
+            return
+        # The fetch callback does RSS HTTP requests that can take seconds;
+        # run it on a worker thread so Tk keeps painting, and disable the
+        # button until the result lands back on the Tk thread. Only the
+        # network fetch runs off-thread - all widget work happens in
+        # _apply_news_result
+        self.update_status("📰 Fetching news...", "#3498db")
+        self.fetch_news_button.config(state=tk.DISABLED)
+        threading.Thread(target=self._fetch_news_worker, daemon=True).start()
+
+    def _fetch_news_worker(self):
+        """Run the fetch-only news callback off the UI thread"""
+        try:
+            result = self.on_fetch_news_callback()
+        except Exception as e:
+            self.logger.error(f"News fetch failed: {e}")
+            result = None
+        # Wrapped in a tuple so a None result is still deliverable.
+        # Dispatch is immediate under mainloop; otherwise the 100 ms
+        # sweep applies it - either way on the Tk thread
+        self._pending_news_result = (result,)
+        self._dispatch_to_ui(self._apply_news_result)
+
+    def _apply_news_result(self):
+        """Apply a completed news fetch (runs on the Tk thread)"""
+        pending = self._pending_news_result
+        if pending is None:
+            return
+        self._pending_news_result = None
+        self._enable_fetch_button()
+        (news_items,) = pending
+        if news_items is None:
+            self.update_status("❌ Error fetching news", "#e94560")
+        elif self.on_news_fetched_callback:
+            self.on_news_fetched_callback(news_items)
+
+    def _enable_fetch_button(self):
+        self.fetch_news_button.config(state=tk.NORMAL)
+
+
+    def update_news(self, news_items):
+        """Update news items and display first page"""
+        self._ensure_news_tab()
+        self.news_items = news_items
+        self.current_page = 0
+        self.current_item_in_page = 0
+        
+        if news_items:
+            self._total_pages = (len(news_items) + self.items_per_page - 1) // self.items_per_page
+            self._news_counter_var.set(f"Loaded {len(news_items)} news items")
+            self._page_var.set(f"Page {self.current_page + 1}/{self._total_pages}")
+            self._display_current_page()
+        else:
+            self._total_pages = 0
+            self._news_counter_var.set("No news loaded")
+            self._page_var.set("Page 0/0")
+            # Clear display
+            self._hide_news_rows(0)
+            if self._no_news_label is not None:
+                self._no_news_label.pack_forget()
+    
+    def _display_current_page(self):
+        """Display 5 news items for current page"""
+        self._ensure_news_tab()
+
+        if not self.news_items:
+            self._hide_news_rows(0)
+            if self._no_news_label is None:
+                self._no_news_label = tk.Label(
+                    self.news_scrollable_frame,
+                    text="No news items found. Click 'Fetch News' to load.",
+                    font=self._fonts['no_news'],
+                    bg=self.bg_color,
+                    fg=self.fg_color,
+                    padx=20,
+                    pady=20
+                )
+            self._no_news_label.pack()
+            return
+
+        if self._no_news_label is not None:
+            self._no_news_label.pack_forget()
+
+        # Calculate which items to show, then reconfigure pooled rows in
+        # place - a page flip during auto-read is a handful of text
+        # configures instead of a destroy/recreate of the whole subtree
+        start_idx = self.current_page * self.items_per_page
+        end_idx = min(start_idx + self.items_per_page, len(self.news_items))
+
+        for i in range(start_idx, end_idx):
+            slot = i - start_idx
+            if slot >= len(self._news_rows):
+                self._news_rows.append(self._create_news_row(slot))
+            self._update_news_row(self._news_rows[slot], self.news_items[i])
+        self._hide_news_rows(end_idx - start_idx)
+
+    def _hide_news_rows(self, first_unused: int):
+        """Unmap pooled news rows from the given slot onwards"""
+        for row in self._news_rows[first_unused:]:
+            if row['visible']:
+                row['frame'].pack_forget()
+                row['visible'] = False
+
+    def _create_news_row(self, slot: int) -> dict:
+        """Build one reusable news row for the given page slot"""
+        # Item frame with border
+        item_frame = tk.Frame(
+            self.news_scrollable_frame,
+            bg="#0f3460",
+            padx=2,
+            pady=2
+        )
+        
+        # Inner frame
+        inner_frame = tk.Frame(item_frame, bg=self.accent_color, padx=15, pady=15)
+        inner_frame.pack(fill=tk.BOTH)
+        
+        # Number badge - the badge shows the slot position on the page,
+        # which never changes for a pooled row, so it's set once here
+        number_label = tk.Label(
+            inner_frame,
+            text=f"{slot + 1}",
+            font=self._fonts['news_number'],
+            bg="#4ecca3",
+            fg=self.bg_color,
+            width=3,
+            height=2
+        )
+        number_label.pack(side=tk.LEFT, padx=(0, 15))
+        
+        # Content frame
+        content_frame = tk.Frame(inner_frame, bg=self.accent_color)
+        content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Title
+        title_label = tk.Label(
+            content_frame,
+            font=self._fonts['news_title'],
+            bg=self.accent_color,
+            fg=self.fg_color,
+            anchor="w",
+            justify=tk.LEFT,
+            wraplength=600
+        )
+        title_label.pack(fill=tk.X, pady=(0, 10))
+        
+        # Description
+        desc_label = tk.Label(
+            content_frame,
+            font=self._fonts['news_desc'],
+            bg=self.accent_color,
+            fg="#cccccc",
+            anchor="w",
+            justify=tk.LEFT,
+            wraplength=600
+        )
+        desc_label.pack(fill=tk.X)
+        self._bind_wraplength(content_frame, [title_label, desc_label], 20)
+
+        return {
+            'frame': item_frame,
+            'title': title_label,
+            'desc': desc_label,
+            'item': None,
+            'visible': False,
+        }
+
+    def _update_news_row(self, row: dict, item):
+        """Reconfigure a pooled news row in place for the given item"""
+        if row['item'] is not item:
+            row['item'] = item
+            row['title'].config(text=item.title)
+            row['desc'].config(text=item.description)
+        if not row['visible']:
+            row['frame'].pack(fill=tk.X, padx=20, pady=10)
+            row['visible'] = True
+    
+    def _on_tab_changed(self, event):
+        """Handle tab change event (auto news fetch and auto-read disabled)"""
+        # Auto-fetch and auto-read are disabled; the only work here is
+        # building a lazy tab the first time it becomes visible
+        index = self.notebook.index('current')
+        if not self._news_tab_built and index == 1:
+            self._ensure_news_tab()
+        elif not self._config_tab_built and index == 2:
+            self._ensure_config_tab()
+        elif index == 0 and self.events:
+            # Auto-refresh idles while this tab is hidden - catch up on
+            # any boundary crossings that happened in the meantime and
+            # re-aim the timer at the next one
+            now_ts = time.time()
+            snapshot = self._status_snapshot(now_ts)
+            if snapshot != self._last_status_snapshot:
+                self._last_status_snapshot = snapshot
+                self._request_refresh()
+            if self._refresh_after_id is not None:
+                self.root.after_cancel(self._refresh_after_id)
+                self._refresh_after_id = self.root.after(
+                    self._next_refresh_delay_ms(now_ts),
+                    self._auto_refresh_events)
+    
+    def start_auto_read(self):
+        """Start automatically reading news page by page"""
+        if not self.news_items or self.auto_read_active:
+            return
+        
+        self.auto_read_active = True
+        self.current_page = 0
+        self.current_item_in_page = 0
+        self._display_current_page()
+        self._read_current_item_auto()
+    
+    def stop_auto_read(self):
+        """Stop auto-reading"""
+        self.auto_read_active = False
+        self._pending_auto_advance = False
+        self._news_cancel_token += 1  # Invalidate all pending callbacks
+        self.logger.info("stop_auto_read: Cleared pending auto-advance, set auto_read_active to False, incremented cancel token")
+    
+    def _read_current_item_auto(self):
+        # FINAL GUARD: Do not read if auto_read_active is now False
+        if not self.auto_read_active:
+            self.logger.warning("_read_current_item_auto: Auto-read not active, aborting news read.")
+            return
+        if not self.news_items:
+            self.logger.warning(f"Cannot read: active={self.auto_read_active}, items=0")
+            return
+        # Calculate absolute index
+        abs_index = self.current_page * self.items_per_page + self.current_item_in_page
+        self.logger.info(f"Reading news at absolute index {abs_index} (page {self.current_page}, item {self.current_item_in_page})")
+        # Capture cancel token at scheduling time
+        cancel_token = self._news_cancel_token
+        if abs_index < len(self.news_items):
+            item = self.news_items[abs_index]
+            # GUARD: Do not invoke callback if auto_read_active is False or token changed
+            if self.on_read_news_callback and self.auto_read_active and cancel_token == self._news_cancel_token:
+                self.on_read_news_callback(item, auto_advance=True)
+            else:
+                self.logger.info("on_read_news_callback skipped: auto_read_active is False or cancel token changed")
+        else:
+            self.logger.error(f"Index {abs_index} out of range (total: {len(self.news_items)})")
+    
+    def schedule_auto_advance(self):
+        """Schedule auto advance from background thread (thread-safe)"""
+        if not self.auto_read_active:
+            self.logger.info("Auto-read not active, not scheduling auto-advance")
+            return
+        # Capture the cancel token now; _apply_auto_advance revalidates it
+        # on the Tk thread before advancing
+        token = self._news_cancel_token
+        if not self._dispatch_to_ui(self._apply_auto_advance, token):
+            self._pending_auto_advance = True
+            self._pending_auto_advance_token = token
+
+    def _apply_auto_advance(self, token: int):
+        """Run a scheduled auto-advance if it wasn't cancelled meanwhile"""
+        if token != self._news_cancel_token:
+            self.logger.info("Skipped scheduled auto-advance: cancel token changed")
+            return
+        self.auto_advance_news()
+    
+    def clear_pending_auto_advance(self):
+        """Clear any pending auto-advance flag immediately."""
+        self._pending_auto_advance = False
+        self.logger.info("Cleared pending auto-advance flag (stop called)")
+    
+    def schedule_voice_processing(self):
+        """Schedule a drain of the voice queue on the Tk thread (thread-safe).
+
+        Wired as the recognizer's on_audio_pending hook. Under mainloop()
+        recognized text is handled as soon as the event loop can get to
+        it; otherwise dispatch declines instantly and the 100 ms sweep
+        drains the queue, so the listen thread never blocks here.
+        """
+        self._dispatch_to_ui(self._process_voice_queue)
+
+    def _process_voice_queue(self):
+        """Drain recognized voice text (runs on the Tk thread)"""
+        # voice_recognition is attached by the controller after init
+        voice_recognition = getattr(self, 'voice_recognition', None)
+        if voice_recognition is not None:
+            voice_recognition.process_pending_audio()
+
+    def _check_pending_updates(self):
+        """Sweep for pending updates from worker threads.
+
+        Under mainloop() background threads push work straight onto the
+        event loop via _dispatch_to_ui and the flags below stay empty;
+        under the update()-driven production loop cross-thread dispatch
+        isn't available, so this sweep IS the delivery path for speaking
+        text, auto-advance and recognized voice input - it has to keep
+        the original 100 ms cadence, not a slower backstop rate.
+        """
+        # The _pending_* flags are unconditionally set in __init__, so
+        # test them directly - no hasattr dance on every 100 ms tick
+        if self._pending_auto_advance:
+            # Only process if token matches
+            if getattr(self, '_pending_auto_advance_token', None) == self._news_cancel_token:
+                self._pending_auto_advance = False
+                self.logger.info("Processing pending auto-advance (token valid)")
+                self.auto_advance_news()
+            else:
+                self._pending_auto_advance = False
+                self.logger.info("Skipped pending auto-advance: cancel token changed")
+
+        # Check for pending speaking text updates
+        if self._pending_speaking_text is not None:
+            text = self._pending_speaking_text
+            self._pending_speaking_text = None
+            self._apply_speaking_text(text)
+
+        # Check for pending hide speaking text
+        if self._pending_hide_speaking:
+            self._pending_hide_speaking = False
+            self._apply_hide_speaking()
+
+        # Completed news fetches from the worker thread
+        if self._pending_news_result is not None:
+            self._apply_news_result()
+
+        # Drain recognized voice text
+        self._process_voice_queue()
+
+        self.root.after(100, self._check_pending_updates)
+    
+    def auto_advance_news(self):
+        """Advance to next news item within page, or next page after all items read"""
+        self.logger.info(f"auto_advance_news called: page={self.current_page}, item={self.current_item_in_page}, active={self.auto_read_active}")
+        if not self.auto_read_active:
+            self.logger.warning("Auto-read not active, stopping (pre-advance)")
+            return
+        # Double-check guard: if auto_read_active was set to False after pending flag, do not advance
+        if not getattr(self, 'auto_read_active', True):
+            self.logger.warning("Auto-read not active (double-check), aborting advance.")
+            return
+
+        # Move to next item in current page
+        self.current_item_in_page += 1
+        self.logger.info(f"Advanced to item {self.current_item_in_page}")
+
+        # Calculate how many items on current page
+        start_idx = self.current_page * self.items_per_page
+        end_idx = min(start_idx + self.items_per_page, len(self.news_items))
+        items_on_page = end_idx - start_idx
+
+        # Check if we finished all items on current page
+        if self.current_item_in_page >= items_on_page:
+            # Move to next page
+            self.current_item_in_page = 0
+            self.current_page += 1
+
+            # Loop back to first page if at end (page count cached by
+            # update_news - it only changes when the items do)
+            if self.current_page >= self._total_pages:
+                self.current_page = 0
+                self.update_status("🔄 Looping back to first page", "#4ecca3")
+
+            # Update page display
+            self._display_current_page()
+            self._page_var.set(f"Page {self.current_page + 1}/{self._total_pages}")
+
+        # FINAL GUARD: Do not continue if auto_read_active is now False
+        if not self.auto_read_active:
+            self.logger.warning("Auto-read not active, stopping (post-advance guard)")
+            return
+
+        # Continue reading
+        self._read_current_item_auto()
+    
+    def run(self):
+        """Start the GUI main loop"""
+        self._ensure_ui()
+        # Only inside mainloop() may worker threads schedule via
+        # after_idle; _dispatch_to_ui checks this flag
+        self._in_mainloop = True
+        try:
+            self.root.mainloop()
+        finally:
+            self._in_mainloop = False
+        
+    def update(self):
+        """Process pending GUI events"""
+        # root.update() dispatches events recursively - events generated
+        # while handling events get dispatched inside the same call, which
+        # is both unbounded and a reentrancy hazard. dooneevent processes
+        # one queued event per call and returns 0 once the queue is
+        # drained, so each update() does a non-recursive pass - and the
+        # budget bounds it even when handlers keep generating new events,
+        # so the caller's loop (voice session checks, event polling) is
+        # never starved by a GUI event storm.
+        self._ensure_ui()
+        dooneevent = self.root.tk.dooneevent
+        budget = _UPDATE_EVENT_BUDGET
+        while budget and dooneevent(_tkinter.DONT_WAIT):
+            budget -= 1
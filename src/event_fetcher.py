@@ -6,10 +6,10 @@ import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a reminder event"""
     id: str
@@ -17,9 +17,15 @@ class Event:
     description: str
     event_time: datetime
     triggered: bool = False
-    
+    # event_time never changes after construction, so the display string
+    # is formatted once here instead of on every refresh that shows it
+    time_hhmm: str = field(init=False, repr=False, default='')
+
+    def __post_init__(self):
+        self.time_hhmm = self.event_time.strftime('%H:%M')
+
     def __str__(self):
-        return f"{self.event_time.strftime('%H:%M')} - {self.title}"
+        return f"{self.time_hhmm} - {self.title}"
 
 
 class EventFetcher:
@@ -30,14 +36,17 @@ class EventFetcher:
         self.events_endpoint = config['backend']['events_endpoint']
         self.timeout = config['backend']['timeout']
         self.logger = logging.getLogger(__name__)
-        
+        # One session for all backend calls - connection pooling keeps the
+        # TCP/TLS handshake out of the per-poll cost
+        self.session = requests.Session()
+
     def fetch_today_events(self) -> List[Event]:
         """Fetch today's events from backend"""
         try:
             url = f"{self.base_url}{self.events_endpoint}"
             self.logger.info(f"Fetching events from {url}")
             
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             events_data = response.json()
@@ -84,7 +93,7 @@ class EventFetcher:
         """Mark an event as triggered in the backend"""
         try:
             url = f"{self.base_url}/events/{event_id}/triggered"
-            response = requests.post(url, timeout=self.timeout)
+            response = self.session.post(url, timeout=self.timeout)
             response.raise_for_status()
             self.logger.info(f"Event {event_id} marked as triggered")
             return True
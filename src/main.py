@@ -6,7 +6,9 @@ import os
 import sys
 import yaml
 import logging
-from logging.handlers import RotatingFileHandler
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 from datetime import datetime, timedelta
 from typing import List
 import threading
@@ -72,6 +74,9 @@ class ReminderSystem:
         self.alarm_system = AlarmSystem(self.config, self.display)
         self.voice_recognition = VoiceRecognition(self.config)
         self.display.voice_recognition = self.voice_recognition  # Ensure display can process audio queue
+        # Wake the GUI when recognized text actually arrives instead of
+        # leaving it to the display's fallback polling sweep
+        self.voice_recognition.on_audio_pending = self.display.schedule_voice_processing
         self.chatbot = Chatbot(self.config, self.secrets)
         self.news_fetcher = NewsFetcher(self.config)
 
@@ -84,14 +89,17 @@ class ReminderSystem:
         self.voice_recognition.on_command = self._handle_voice_command
         self.voice_recognition.on_text = self._handle_voice_text
         self.display.set_stop_alarm_callback(self._stop_alarm)
-        self.display.set_news_callbacks(self._fetch_news, self._read_news)
+        self.display.set_news_callbacks(self._fetch_news_items, self._read_news,
+                                        self._on_news_fetched)
         self.display.set_config_callback(self._save_configuration)
 
         # Background threads
         self.check_thread = None
 
-        # News TTS queue and worker
-        self.news_tts_queue = []
+        # News TTS queue and worker - deque gives O(1) popleft and its
+        # append/popleft/clear are atomic, so the GUI thread enqueues
+        # without taking a lock against the worker
+        self.news_tts_queue = deque()
         self.news_tts_thread = None
         self.news_tts_stop_event = threading.Event()
         self.news_cancel_token = 0  # Sync with display_manager
@@ -159,10 +167,18 @@ class ReminderSystem:
         )
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
-        
-        # Add handlers
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+
+        # Decouple log emission from disk/console I/O: callers only enqueue
+        # the record (cheap, non-blocking) and a listener thread does the
+        # formatting and writes. Keeps logger.info out of the way in the
+        # TTS and alarm hot paths.
+        log_queue = SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler,
+            respect_handler_level=True
+        )
+        self._log_listener.start()
     
     def start(self):
         """Start the reminder system"""
@@ -370,21 +386,30 @@ class ReminderSystem:
         self.alarm_system.speak_async("Alarm stopped")
     
     def _fetch_news(self):
-        """Fetch news from RSS feeds"""
-        self.logger.info("Fetching news from RSS feeds")
+        """Fetch news and apply the results (runs on the main thread).
+
+        The display's fetch button instead runs _fetch_news_items on a
+        worker thread and delivers _on_news_fetched back on the Tk
+        thread, so long RSS requests don't freeze the GUI.
+        """
         self.display.update_status("📰 Fetching news...", "#3498db")
-        
-        try:
-            # Fetch news directly (it's fast enough)
-            news_items = self.news_fetcher.fetch_news(max_items_per_feed=5)
+        news_items = self._fetch_news_items()
+        if news_items is not None:
             self._on_news_fetched(news_items)
-            
+        else:
+            self.display.update_status(f"❌ Error fetching news", "#e94560")
+
+    def _fetch_news_items(self):
+        """Fetch news from RSS feeds - network only, safe off-thread"""
+        self.logger.info("Fetching news from RSS feeds")
+        try:
+            return self.news_fetcher.fetch_news(max_items_per_feed=5)
         except Exception as e:
             self.logger.error(f"Error fetching news: {e}")
-            self.display.update_status(f"❌ Error fetching news", "#e94560")
-    
+            return None
+
     def _on_news_fetched(self, news_items):
-        """Handle news fetch completion"""
+        """Handle news fetch completion (runs on the main/Tk thread)"""
         self.display.update_news(news_items)
         self.display.update_status(f"✅ Fetched {len(news_items)} news items", "#4ecca3")
         self.logger.info(f"News fetched: {len(news_items)} items")
@@ -405,7 +430,7 @@ class ReminderSystem:
 
     def _news_tts_worker(self):
         while self.news_tts_queue and not self.news_tts_stop_event.is_set():
-            news_item, auto_advance, scheduled_token = self.news_tts_queue.pop(0)
+            news_item, auto_advance, scheduled_token = self.news_tts_queue.popleft()
             # Check cancellation token before TTS
             current_token = getattr(self.display, '_news_cancel_token', 0)
             if scheduled_token != current_token:
@@ -591,9 +616,14 @@ class ReminderSystem:
         # Cleanup
         self.alarm_system.cleanup()
         self.voice_recognition.cleanup()
-        
+
         self.logger.info("System stopped")
 
+        # Flush queued log records before the process exits
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
 
 def main():
     """Main entry point"""
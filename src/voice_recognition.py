@@ -56,6 +56,10 @@ class VoiceRecognition:
         self.is_listening = False
         self.listen_thread: Optional[threading.Thread] = None
         self.audio_queue = queue.Queue()
+        # Optional hook fired from the listen thread when recognized text
+        # lands on the queue, so the GUI can schedule a drain immediately
+        # instead of discovering it on a polling tick
+        self.on_audio_pending = None
 
         # Callbacks
         self.on_command: Optional[Callable[[str], None]] = None
@@ -210,6 +214,8 @@ class VoiceRecognition:
                         self.logger.debug(f"Recognized: {text}")
                         # Instead of calling _process_text directly, put in queue
                         self.audio_queue.put(text)
+                        if self.on_audio_pending:
+                            self.on_audio_pending()
 
         except Exception as e:
             self.logger.error(f"Error in Vosk listen loop: {e}")